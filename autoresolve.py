@@ -0,0 +1,153 @@
+#autoresolve.py
+#Haley Burley
+#10/19/2026
+
+"""
+autoresolve.py
+
+Computes the exact outcome distribution of a fight that follows the combat_loop rules
+(the player always attacks, never drinks potions and never runs), so weak fights can be
+resolved in one step. Each state (player HP, monster HP, weapon durability, armor
+durability) is solved once with dynamic programming and memoized, so every later fight
+with the same stats is a table lookup.
+
+Combat rules modeled, one round at a time:
+- With a weapon the player hits for 10-20 and the weapon loses 1 durability
+  (it breaks at 0); without one the player hits for 5-10.
+- The monster always hits back, even on the round it is defeated. Armor absorbs
+  5 damage and loses 1 durability per hit.
+- The fight ends when the monster's HP or the player's HP drops to 0 or below.
+
+Functions:
+- outcome_distribution(player_hp, monster_hp, weapon_dur, armor_dur, monster_power)
+    Returns every possible end state of a fight with its probability.
+
+- fight_summary(player_hp, monster_hp, weapon_dur, armor_dur, monster_power, monster_money)
+    Returns the win, defeat and revive chances and the expected gold.
+
+- sample_outcome(player_hp, monster_hp, weapon_dur, armor_dur, monster_power, roll)
+    Picks one end state according to the exact distribution.
+"""
+
+import bisect
+from functools import lru_cache
+from rngbuffer import rng
+
+ARMOR_BLOCK = 5
+
+@lru_cache(maxsize=None)
+def outcome_distribution(player_hp, monster_hp, weapon_dur, armor_dur, monster_power):
+    """
+    Solves a fight exactly from the given state.
+
+    Args:
+        player_hp (int): The player's HP.
+        monster_hp (int): The monster's HP.
+        weapon_dur (int): Durability left on the equipped weapon, 0 if none.
+        armor_dur (int): Durability left across all armor in the inventory, 0 if none.
+        monster_power (int): Damage the monster deals per hit before armor.
+
+    Returns:
+        tuple: (probability, (player_hp, monster_hp, weapon_dur, armor_dur)) pairs, one
+            per distinct end state, sorted by end state.
+    """
+    if player_hp <= 0 or monster_hp <= 0:
+        return ((1.0, (player_hp, monster_hp, weapon_dur, armor_dur)),)
+
+    if weapon_dur > 0:
+        damages = range(10, 21)
+        next_weapon = weapon_dur - 1
+    else:
+        damages = range(5, 11)
+        next_weapon = 0
+
+    if armor_dur > 0:
+        damage_taken = max(0, monster_power - ARMOR_BLOCK)
+        next_armor = armor_dur - 1
+    else:
+        damage_taken = monster_power
+        next_armor = 0
+
+    next_hp = player_hp - damage_taken
+    chance = 1.0 / len(damages)
+    outcomes = {}
+
+    for damage in damages:
+        next_monster = monster_hp - damage
+        for p, end_state in outcome_distribution(next_hp, next_monster, next_weapon,
+                                                 next_armor, monster_power):
+            outcomes[end_state] = outcomes.get(end_state, 0.0) + chance * p
+
+    return tuple(sorted(((p, state) for state, p in outcomes.items()), key=lambda x: x[1]))
+
+@lru_cache(maxsize=None)
+def _cumulative(player_hp, monster_hp, weapon_dur, armor_dur, monster_power):
+    """
+    Returns running probability totals and end states for fast sampling.
+    """
+    totals = []
+    states = []
+    running = 0.0
+    for p, state in outcome_distribution(player_hp, monster_hp, weapon_dur,
+                                         armor_dur, monster_power):
+        running += p
+        totals.append(running)
+        states.append(state)
+    return totals, states
+
+def fight_summary(player_hp, monster_hp, weapon_dur, armor_dur, monster_power, monster_money):
+    """
+    Summarizes a fight's exact outcome distribution.
+
+    Args:
+        player_hp (int): The player's HP.
+        monster_hp (int): The monster's HP.
+        weapon_dur (int): Durability left on the equipped weapon, 0 if none.
+        armor_dur (int): Durability left across all armor, 0 if none.
+        monster_power (int): Damage the monster deals per hit before armor.
+        monster_money (float): Gold the monster drops when defeated.
+
+    Returns:
+        dict: "win" (monster defeated and player standing), "defeat" (player down,
+            monster standing), "revive" (player down for any reason) probabilities,
+            and "expected_gold" earned from the monster.
+    """
+    win = defeat = revive = killed = 0.0
+    for p, (hp, m_hp, _, _) in outcome_distribution(player_hp, monster_hp, weapon_dur,
+                                                    armor_dur, monster_power):
+        if m_hp <= 0:
+            killed += p
+        if hp <= 0:
+            revive += p
+            if m_hp > 0:
+                defeat += p
+        else:
+            win += p
+    return {
+        "win": win,
+        "defeat": defeat,
+        "revive": revive,
+        "expected_gold": killed * monster_money,
+    }
+
+def sample_outcome(player_hp, monster_hp, weapon_dur, armor_dur, monster_power, roll=None):
+    """
+    Picks one end state of a fight according to its exact probability.
+
+    Args:
+        player_hp (int): The player's HP.
+        monster_hp (int): The monster's HP.
+        weapon_dur (int): Durability left on the equipped weapon, 0 if none.
+        armor_dur (int): Durability left across all armor, 0 if none.
+        monster_power (int): Damage the monster deals per hit before armor.
+        roll (float, optional): A uniform value in [0, 1) to sample with, e.g. one of a
+            batch from rng.randoms. Drawn from the shared buffer if not given.
+
+    Returns:
+        tuple: (player_hp, monster_hp, weapon_dur, armor_dur) at the end of the fight.
+    """
+    if roll is None:
+        roll = rng.random()
+    totals, states = _cumulative(player_hp, monster_hp, weapon_dur, armor_dur, monster_power)
+    index = bisect.bisect_right(totals, roll * totals[-1])
+    return states[min(index, len(states) - 1)]
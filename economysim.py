@@ -0,0 +1,224 @@
+#economysim.py
+#Haley Burley
+#10/19/2026
+
+"""
+economysim.py
+
+Simulates how gold moves through the game by running many scripted bot players
+through the town -> map -> fight -> town cycle without any input, output or window.
+Agents are split into chunks that run in a process pool, and each chunk reports
+per-hour totals that are added together into economy metrics.
+
+Each bot turn follows the same rules and prices as the game:
+- In town it sleeps at the Inn when hurt, buys a sword or shield when it has none
+  and can afford one, and crafts a potion when it holds a matching ingredient pair.
+  Crafting only uses up the ingredients and is counted in potions_crafted; bots never
+  drink potions, since autoresolve models fights without them.
+- Then it leaves town and fights one monster, resolved with autoresolve's exact
+  combat distribution, collecting gold and the monster's ingredient drop.
+- If it is defeated, the doctor revives it (free the first time, then for a fee).
+
+Functions:
+- simulate_chunk(agent_count, hours, turns_per_hour, seed)
+    Runs a group of agents in one process and returns per-hour totals.
+
+- run_simulation(agent_count, hours, turns_per_hour, workers, seed)
+    Spreads the agents over a process pool and combines the results.
+"""
+
+import os
+import time
+import argparse
+from multiprocessing import Pool
+
+import autoresolve
+import rngbuffer
+import monstertemplates
+import gamefunctions
+
+TURNS_PER_HOUR = 12
+START_HP = 30
+START_GOLD = 10
+MAX_HP = 30
+
+METRICS = [
+    "monster_gold", "sleep_spent", "doctor_spent", "shop_spent",
+    "fights", "wins", "defeats", "sleeps", "purchases", "potions_crafted",
+]
+
+def _new_agent():
+    """
+    Returns the state of a bot starting a new game.
+    """
+    return {
+        "hp": START_HP,
+        "gold": START_GOLD,
+        "weapon_dur": 0,
+        "armor_dur": 0,
+        "doctor_visits": 0,
+        "ingredients": {},
+    }
+
+def _town_turn(agent, totals, prices, max_durability):
+    """
+    Runs the bot's town decisions: sleep, shop and craft.
+    """
+    if agent["hp"] <= MAX_HP - gamefunctions.SLEEP_HEAL and agent["gold"] >= gamefunctions.SLEEP_COST:
+        agent["gold"] -= gamefunctions.SLEEP_COST
+        agent["hp"] = min(agent["hp"] + gamefunctions.SLEEP_HEAL, MAX_HP)
+        totals["sleep_spent"] += gamefunctions.SLEEP_COST
+        totals["sleeps"] += 1
+
+    for item_id, slot in (("sword", "weapon_dur"), ("shield", "armor_dur")):
+        # Gold can be negative after a doctor fee, so check it before buying
+        if agent[slot] == 0 and agent["gold"] >= prices[item_id]:
+            bought, agent["gold"] = gamefunctions.purchase_item(prices[item_id], agent["gold"], 1)
+            if bought > 0:
+                agent[slot] = max_durability[item_id]
+                totals["shop_spent"] += prices[item_id]
+                totals["purchases"] += 1
+
+    ingredients = agent["ingredients"]
+    for recipe in gamefunctions.POTION_RECIPES:
+        if all(ingredients.get(name, 0) > 0 for name in recipe):
+            for name in recipe:
+                ingredients[name] -= 1
+            totals["potions_crafted"] += 1
+            break
+
+def _map_turn(agent, totals, monster, roll):
+    """
+    Runs one fight against a pre-rolled monster, using a pre-drawn uniform roll to pick
+    its outcome, and the doctor visit if the bot loses.
+    """
+    totals["fights"] += 1
+
+    end_hp, end_monster_hp, agent["weapon_dur"], agent["armor_dur"] = autoresolve.sample_outcome(
+        agent["hp"], monster["health"], agent["weapon_dur"], agent["armor_dur"], monster["power"], roll)
+
+    if end_monster_hp <= 0:
+        agent["gold"] += monster["money"]
+        totals["monster_gold"] += monster["money"]
+        drop_name = gamefunctions.INGREDIENT_DROPS.get(monster["name"])
+        if drop_name:
+            agent["ingredients"][drop_name] = agent["ingredients"].get(drop_name, 0) + 1
+
+    if end_hp <= 0:
+        totals["defeats"] += 1
+        agent["doctor_visits"] += 1
+        agent["hp"] = gamefunctions.REVIVE_HP
+        if agent["doctor_visits"] > 1:
+            agent["gold"] -= gamefunctions.DOCTOR_FEE
+            totals["doctor_spent"] += gamefunctions.DOCTOR_FEE
+    else:
+        totals["wins"] += 1
+        agent["hp"] = end_hp
+
+def simulate_chunk(agent_count, hours, turns_per_hour=TURNS_PER_HOUR, seed=None):
+    """
+    Runs a group of bot players for a number of simulated hours.
+
+    Args:
+        agent_count (int): Number of bots in this group.
+        hours (int): Simulated hours to run.
+        turns_per_hour (int, optional): Town + map cycles per bot per hour. Defaults to TURNS_PER_HOUR.
+        seed (int, optional): Seed for a reproducible run.
+
+    Returns:
+        list: One dict per hour with the METRICS totals plus "gold_held", the gold all
+            bots hold at the end of the hour.
+    """
+    rngbuffer.seed(seed)
+    _, shop_index = gamefunctions.load_shop_catalog()
+    prices = {item_id: item["price"] for item_id, item in shop_index.items()}
+    max_durability = {item_id: item.get("maxDurability", 0) for item_id, item in shop_index.items()}
+
+    agents = [_new_agent() for _ in range(agent_count)]
+    hourly = []
+
+    for _ in range(hours):
+        totals = dict.fromkeys(METRICS, 0)
+        for _ in range(turns_per_hour):
+            # Every agent's monster and fight roll for this turn are drawn in bulk
+            monsters = monstertemplates.roll_monsters(agent_count)
+            rolls = rngbuffer.rng.randoms(agent_count)
+            for agent, monster, roll in zip(agents, monsters, rolls):
+                _town_turn(agent, totals, prices, max_durability)
+                _map_turn(agent, totals, monster, roll)
+        totals["gold_held"] = sum(agent["gold"] for agent in agents)
+        hourly.append(totals)
+
+    return hourly
+
+def _run_chunk(args):
+    """
+    Unpacks pool arguments for simulate_chunk.
+    """
+    return simulate_chunk(*args)
+
+def run_simulation(agent_count, hours, turns_per_hour=TURNS_PER_HOUR, workers=None, seed=None):
+    """
+    Runs the economy simulation across a process pool.
+
+    Args:
+        agent_count (int): Total number of bots.
+        hours (int): Simulated hours to run.
+        turns_per_hour (int, optional): Town + map cycles per bot per hour. Defaults to TURNS_PER_HOUR.
+        workers (int, optional): Number of processes. Defaults to the CPU count.
+        seed (int, optional): Base seed; each chunk uses seed + its chunk number.
+
+    Returns:
+        list: One dict per hour with the summed METRICS, "gold_held", "agents" and
+            "mean_gold" across every bot.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunk_count = workers * 4
+    base, extra = divmod(agent_count, chunk_count)
+    jobs = []
+    for i in range(chunk_count):
+        size = base + (1 if i < extra else 0)
+        if size:
+            chunk_seed = None if seed is None else seed + i
+            jobs.append((size, hours, turns_per_hour, chunk_seed))
+
+    with Pool(workers) as pool:
+        results = pool.map(_run_chunk, jobs)
+
+    combined = []
+    for hour in range(hours):
+        totals = dict.fromkeys(METRICS + ["gold_held"], 0)
+        for chunk in results:
+            for key, value in chunk[hour].items():
+                totals[key] += value
+        totals["agents"] = agent_count
+        totals["mean_gold"] = totals["gold_held"] / agent_count if agent_count else 0.0
+        combined.append(totals)
+    return combined
+
+def main():
+    """
+    Runs the simulation from the command line and prints an hourly report.
+    """
+    parser = argparse.ArgumentParser(description="Simulate the adventure game economy.")
+    parser.add_argument("--agents", type=int, default=10000)
+    parser.add_argument("--hours", type=int, default=8)
+    parser.add_argument("--turns-per-hour", type=int, default=TURNS_PER_HOUR)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = run_simulation(args.agents, args.hours, args.turns_per_hour, args.workers, args.seed)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'Hour':>4} {'Earned':>12} {'Inn':>10} {'Doctor':>10} {'Shop':>10} {'Mean gold':>10} {'Win %':>6}")
+    for hour, totals in enumerate(report, 1):
+        win_rate = totals["wins"] / totals["fights"] * 100 if totals["fights"] else 0.0
+        print(f"{hour:>4} {totals['monster_gold']:>12.2f} {totals['sleep_spent']:>10} "
+              f"{totals['doctor_spent']:>10} {totals['shop_spent']:>10} "
+              f"{totals['mean_gold']:>10.2f} {win_rate:>6.1f}")
+    print(f"Simulated {args.agents} agents for {args.hours} hours in {elapsed:.2f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#eventbus.py
+#Haley Burley
+#10/19/2026
+
+"""
+eventbus.py
+
+A structured stream of gameplay events (hits, drops, purchases, revives, map
+encounters) for analytics. Game code publishes small dictionaries to a shared bus,
+which keeps the most recent ones in a fixed-size ring buffer and hands them to any
+attached sinks. The JSONL sink only queues events on the caller's thread; a background
+thread writes them out in batches and rotates the file when it grows too large, so a
+combat turn never waits on the disk. A chunk that fails to write (a full disk, a value
+JSON can't encode) is reported and dropped instead of stopping the writer, and the
+queue holds at most MAX_PENDING events, dropping the oldest, if the writer falls behind.
+
+Classes:
+- EventBus(ring_size)
+    Publishes events to a ring buffer and to subscribed handlers.
+
+- JsonlSink(filename, batch_size, flush_interval, max_bytes, backup_count, max_pending)
+    Writes events to a JSON Lines file from a background thread, with size-based rotation.
+
+Functions:
+- publish(event_type, **fields)
+    Publishes an event on the shared bus.
+
+- start_file_log(filename)
+    Attaches a JsonlSink to the shared bus and closes it when the game exits.
+"""
+
+import os
+import json
+import time
+import atexit
+import threading
+from collections import deque
+
+EVENT_LOG_FILE = "game_events.jsonl"
+RING_SIZE = 1000
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 1.0                # seconds
+MAX_LOG_BYTES = 10 * 1024 * 1024
+BACKUP_COUNT = 5
+MAX_PENDING = 100000
+
+class EventBus:
+    def __init__(self, ring_size=RING_SIZE):
+        self.ring = deque(maxlen=ring_size)
+        self.handlers = []
+        self.seq = 0
+
+    def subscribe(self, handler):
+        """
+        Calls handler(event) for every event published from now on.
+        """
+        self.handlers.append(handler)
+
+    def unsubscribe(self, handler):
+        """
+        Stops sending events to a handler.
+        """
+        if handler in self.handlers:
+            self.handlers.remove(handler)
+
+    def publish(self, event_type, **fields):
+        """
+        Records an event in the ring buffer and passes it to every handler.
+
+        Args:
+            event_type (str): What happened, e.g. "combat_hit" or "item_purchased".
+            **fields: JSON-friendly details of the event.
+
+        Returns:
+            dict: The event, with "seq", "time" and "type" added.
+        """
+        self.seq += 1
+        event = {"seq": self.seq, "time": time.time(), "type": event_type}
+        event.update(fields)
+        self.ring.append(event)
+        for handler in self.handlers:
+            handler(event)
+        return event
+
+    def recent(self, count=None, event_type=None):
+        """
+        Returns events from the ring buffer, oldest first.
+
+        Args:
+            count (int, optional): Only the last this many matching events. Defaults to all.
+            event_type (str, optional): Only events of this type. Defaults to every type.
+
+        Returns:
+            list: The matching events.
+        """
+        events = [e for e in self.ring if event_type is None or e["type"] == event_type]
+        return events if count is None else events[-count:]
+
+class JsonlSink:
+    def __init__(self, filename=EVENT_LOG_FILE, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL,
+                 max_bytes=MAX_LOG_BYTES, backup_count=BACKUP_COUNT, max_pending=MAX_PENDING):
+        self.filename = filename
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+        self.pending = deque(maxlen=max_pending)
+        self.dropped = 0  # events lost to a full queue or a failed write
+        self.wake = threading.Event()
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, name="event-log", daemon=True)
+        self.thread.start()
+
+    def __call__(self, event):
+        """
+        Queues an event for the writer thread. deque.append is thread-safe, so this
+        takes no lock and does no I/O. If the writer has fallen max_pending events
+        behind, the oldest queued event is dropped.
+        """
+        if len(self.pending) == self.pending.maxlen:
+            self.dropped += 1  # the append below pushes out the oldest event
+        self.pending.append(event)
+        if len(self.pending) >= self.batch_size:
+            self.wake.set()
+
+    def _run(self):
+        while not self.closed:
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self._write_pending()
+        self._write_pending()
+
+    def _write_pending(self):
+        """
+        Serializes everything queued so far and writes it in chunks of at most
+        batch_size events. The log is rotated before any chunk that would push it past
+        max_bytes, so a file only grows past the limit if one chunk alone is bigger.
+        Events that can't be encoded and chunks that can't be written are counted in
+        dropped and reported, so one bad event or a full disk doesn't stop the writer.
+        """
+        while self.pending:
+            lines = []
+            while self.pending and len(lines) < self.batch_size:
+                event = self.pending.popleft()
+                try:
+                    lines.append(json.dumps(event, separators=(",", ":")) + "\n")
+                except (TypeError, ValueError) as e:
+                    self.dropped += 1
+                    print(f"Skipped an event the log can't encode: {e}")
+            if not lines:
+                continue
+            try:
+                self._write_chunk("".join(lines))
+            except OSError as e:
+                self.dropped += len(lines)
+                print(f"Error writing event log, {len(lines)} events dropped: {e}")
+
+    def _write_chunk(self, chunk):
+        """
+        Appends serialized events, rotating first if they would push the log past max_bytes.
+        """
+        try:
+            size = os.path.getsize(self.filename)
+        except FileNotFoundError:
+            size = 0
+        if size and size + len(chunk) > self.max_bytes:
+            self._rotate()
+
+        with open(self.filename, "a") as f:
+            f.write(chunk)
+
+    def _rotate(self):
+        """
+        Renames game_events.jsonl to .1, .1 to .2 and so on, dropping the oldest.
+        """
+        for i in range(self.backup_count - 1, 0, -1):
+            older = f"{self.filename}.{i}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.filename}.{i + 1}")
+        if self.backup_count > 0:
+            os.replace(self.filename, f"{self.filename}.1")
+        else:
+            os.remove(self.filename)
+
+    def close(self):
+        """
+        Writes any queued events and stops the writer thread.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.wake.set()
+        self.thread.join()
+
+bus = EventBus()
+
+def publish(event_type, **fields):
+    """
+    Publishes an event on the shared bus. See EventBus.publish.
+    """
+    return bus.publish(event_type, **fields)
+
+def start_file_log(filename=EVENT_LOG_FILE):
+    """
+    Starts writing the shared bus's events to a JSONL file in the background.
+
+    Args:
+        filename (str, optional): The log file. Defaults to EVENT_LOG_FILE.
+
+    Returns:
+        JsonlSink: The sink, already subscribed and set to close at exit.
+    """
+    sink = JsonlSink(filename)
+    bus.subscribe(sink)
+    atexit.register(sink.close)
+    return sink
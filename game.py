@@ -9,30 +9,46 @@ This script imports functions from gamefunctions.py and calls those functions fo
 adventure-style game where you can buy items and fight monsters.
 """
 import gamefunctions
+import eventbus
+import worldserver
+from textscreen import TextScreen
+
+GEAR_CHOICES = ["1", "3", "4", "5", "7", "8"]
 
 def main():
     """
     Runs the main game logic, prompting user input and using imported functions.
     """
+    eventbus.start_file_log()
+
     (player_name, player_hp, player_gold, max_hp,
-    player_inventory, equipped_weapon, equipped_armor, doctor_visits) = gamefunctions.start_game()
+    doctor_visits, saved_game) = gamefunctions.start_game()
+    player_inventory = equipped_weapon = equipped_armor = None
+
+    screen = TextScreen()
 
     while True:
-        print("\nYou are in town.")
-        print(f"Current HP: {player_hp}, Current Gold: {player_gold:.2f}")
-        print("What would you like to do?")
-        print("1) Leave town (Fight Monster)")
-        print("2) Sleep (Restore HP for 5 Gold)")
-        print("3) Visit Shop")
-        print("4) Equip Item")
-        print("5) Craft Potion")
-        print("6) Quit")
-        print("7) Save and Quit")
-
-        choice = input("Enter choice (1-7): ")
-        while choice not in ["1", "2", "3", "4", "5", "6", "7"]:
-            print("Invalid input. Please choose 1, 2, 3, 4, 5, 6, or 7.")
-            choice = input("Enter choice (1-7): ")
+        screen.add("\nYou are in town.")
+        screen.add(f"Current HP: {player_hp}, Current Gold: {player_gold:.2f}")
+        screen.add("What would you like to do?")
+        screen.add("1) Leave town (Fight Monster)")
+        screen.add("2) Sleep (Restore HP for 5 Gold)")
+        screen.add("3) Visit Shop")
+        screen.add("4) Equip Item")
+        screen.add("5) Craft Potion")
+        screen.add("6) Quit")
+        screen.add("7) Save and Quit")
+        screen.add("8) Join Shared World")
+        screen.flush()
+
+        choice = input("Enter choice (1-8): ")
+        while choice not in ["1", "2", "3", "4", "5", "6", "7", "8"]:
+            print("Invalid input. Please choose 1, 2, 3, 4, 5, 6, 7, or 8.")
+            choice = input("Enter choice (1-8): ")
+
+        # A resumed save's inventory is only decoded once a choice needs it
+        if player_inventory is None and choice in GEAR_CHOICES:
+            player_inventory, equipped_weapon, equipped_armor = gamefunctions.load_saved_gear(saved_game)
 
         if choice == "1":
             player_hp, player_gold, equipped_weapon, doctor_visits = gamefunctions.explore_until_town(
@@ -52,6 +68,10 @@ def main():
             gamefunctions.save_and_quit("savefile.json", player_name, player_hp,
                 player_gold, max_hp, player_inventory, equipped_weapon, equipped_armor, doctor_visits)
             break
+        elif choice == "8":
+            player_hp, player_gold, equipped_weapon, doctor_visits = worldserver.explore_shared_world(
+                worldserver.DEFAULT_SOCKET, player_name, player_hp, player_gold,
+                player_inventory, equipped_weapon, doctor_visits)
 
 if __name__ == "__main__":
     main()
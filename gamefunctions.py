@@ -18,6 +18,12 @@ Functions:
 - purchase_item(itemPrice, startingMoney, quantityToPurchase):
     Calculates how many items can be bought with available money.
 
+- load_shop_catalog(filename):
+    Loads the shop's items from shop_items.json once and indexes them by id.
+
+- buy_items(item_id, quantity, player_gold, inventory):
+    Buys as many of one catalog item as requested and affordable.
+
 - visit_shop(player_gold, inventory):
     Displays a shop menu and allows the player to purchase items.
 
@@ -33,6 +39,9 @@ Functions:
 - combat_loop(player_hp, monster, player_gold, weapon, inventory):
     Runs the combat sequence between the player and the monster, updating health and inventory.
 
+- auto_resolve_fight(player_hp, monster, player_gold, weapon, inventory):
+    Resolves a fight in one step from its exact outcome distribution.
+
 - handle_monster_fight(player_hp, player_gold, inventory, equipped_weapon):
     Sets up a monster encounter and lets the player fight or use a consumable.
 
@@ -46,10 +55,16 @@ Functions:
     Restores player HP by a fixed amount in exchange for gold.
 
 - save_game(filename, game_data):
-    Saves the player’s game state to a JSON file.
+    Saves the player’s game state to a sectioned save file.
 
 - load_game(filename):
-    Loads and returns game data from a JSON file.
+    Opens a save file; each section is only decoded when one of its fields is read.
+
+- load_saved_gear(saved_game):
+    Decodes the inventory and equipment of a resumed save.
+
+- find_equipped_item(inventory, saved_item):
+    Matches a saved equipped item to the item in the loaded inventory.
 
 - start_game(filename="savefile.json"):
     Prompts the player to start a new game or load a previous save, returning full game state.
@@ -57,7 +72,34 @@ Functions:
 - save_and_quit(filename, player_name, player_hp, player_gold, max_hp, inventory, weapon, armor):
     Saves all game data to a file and exits the game.
 
-- launch_map(player_pos, monster_pos, town_pos)
+- load_map_images(tile_size)
+    Loads and scales the player and monster sprites for the map.
+
+- move_player(key, player_pos, grid_size)
+    Moves the player one tile for an arrow key press.
+
+- move_map_monsters(state, player_pos, monster_index)
+    Moves every wandering monster on the map one step, in place.
+
+- remember_positions(previous_positions, monsters)
+    Copies monster positions into a reusable list for drawing between ticks.
+
+- monster_description(monster)
+    Looks up a monster's description from its type's template.
+
+- draw_map(screen, state, player_pos, town_pos, player_image, monster_images, ..., camera, monster_index)
+    Draws the part of the map inside the camera's view onto a window or offscreen surface.
+
+- persist_monster_positions(state, world)
+    Logs monster positions that changed since they were last saved.
+
+- monster_move_alpha(scheduler)
+    How far the monsters are through their current move, for drawing.
+
+- create_world_scheduler(state, player_pos, world)
+    Builds the fixed-timestep scheduler that moves monsters independently of key presses.
+
+- launch_map(player_pos, town_pos)
     Launches the Pygame window and handles user input to move around a 10x10 grid.
 
 - get_persistent_map_state()
@@ -72,18 +114,40 @@ Functions:
 - explore_until_town(player_hp, player_gold, inventory, equipped_weapon, doctor_visits)
     Keeps the player in the map exploration loop until they return to town or exit.
 
+- world_population(state, index)
+    Returns the long-lived population manager for the world log's cached state.
+
+- spawn_due_monsters()
+    Respawns monsters whose respawn timers have run out.
+
 - init_wandering_monsters()
-    Initializes or reloads two monsters on the map and persists them.
+    Fills every map region up to its target number of monsters and persists them.
+
+- record_monster_fight(monster_data, encounter)
+    Persists a map fight's result to the world log.
 
-- handle_adventure_with_monster(player_hp, player_gold, inventory, equipped_weapon, doctor_visits, monster_data)
+- handle_adventure_with_monster(player_hp, player_gold, inventory, equipped_weapon, doctor_visits, monster_data, record_fight)
     Handles combat using a specific monster passed from the map.
 """
 
-import random
 import pygame
 import os
 import json
-from wanderingMonster import WanderingMonster
+import time
+import monstertemplates
+import autoresolve
+import worldlog
+import eventbus
+import itemprototypes
+import savefile
+import spriteatlas
+import population
+from rngbuffer import rng
+from wanderingMonster import WanderingMonster, DIRECTION_ORDERS
+from monsterindex import MonsterIndex
+from textscreen import TextScreen
+from worldscheduler import WorldScheduler
+from mapcamera import Camera
 
 def print_welcome(name: str) -> None:
     """
@@ -95,9 +159,11 @@ def print_welcome(name: str) -> None:
     Returns:
         None 
     """
-    print(f"\n{'=' * 40}")
-    print(f"{'Hello, ' + name + '!':^40}")
-    print(f"{'=' * 40}\n")
+    screen = TextScreen()
+    screen.add(f"\n{'=' * 40}")
+    screen.add(f"{'Hello, ' + name + '!':^40}")
+    screen.add(f"{'=' * 40}\n")
+    screen.flush()
 
 def print_shop_menu(item1Name: str, item1Price: float, item2Name: str, item2Price: float) -> None:
     """
@@ -122,10 +188,12 @@ def print_shop_menu(item1Name: str, item1Price: float, item2Name: str, item2Pric
     border = f"/{'-' * (len(line1) - 2)}\\"
     bottom = f"\\{'-' * (len(line1) - 2)}/"
 
-    print(border)
-    print(line1)
-    print(line2)
-    print(bottom)
+    screen = TextScreen()
+    screen.add(border)
+    screen.add(line1)
+    screen.add(line2)
+    screen.add(bottom)
+    screen.flush()
 
 def purchase_item(itemPrice: float, startingMoney: float, quantityToPurchase: int = 1) -> tuple:
     """
@@ -146,10 +214,57 @@ def purchase_item(itemPrice: float, startingMoney: float, quantityToPurchase: in
         max_purchasable = int(startingMoney // itemPrice)
         return max_purchasable, startingMoney - (max_purchasable * itemPrice)
 
+SHOP_CATALOG_FILE = "shop_items.json"
+
+_shop_catalog = None
+_shop_index = None
+
+def load_shop_catalog(filename=SHOP_CATALOG_FILE):
+    """
+    Loads the shop catalog from a JSON file the first time it is needed.
+
+    Args:
+        filename (str, optional): JSON file holding the list of items for sale. Defaults to shop_items.json.
+
+    Returns:
+        tuple: (list) Items for sale in menu order, (dict) item id -> item.
+    """
+    global _shop_catalog, _shop_index
+    if _shop_catalog is None:
+        with open(filename, 'r') as f:
+            _shop_catalog = json.load(f)
+        _shop_index = {item["id"]: item for item in _shop_catalog}
+        for item in _shop_catalog:
+            itemprototypes.register_item_prototype(item)
+    return _shop_catalog, _shop_index
+
+def buy_items(item_id, quantity, player_gold, inventory):
+    """
+    Buys up to the requested number of one catalog item, as many as the player can afford.
+    Nothing is bought when the player's gold is below the price, including when doctor
+    fees have left it negative.
+
+    Args:
+        item_id (str): The catalog id of the item.
+        quantity (int): How many the player wants.
+        player_gold (float): The player's current gold.
+        inventory (list): The player's inventory list of items.
+
+    Returns:
+        tuple: (int) Number of items bought, (float) Updated player gold.
+    """
+    _, shop_index = load_shop_catalog()
+    item = shop_index[item_id]
+    if player_gold < item["price"]:
+        return 0, player_gold
+    bought, player_gold = purchase_item(item["price"], player_gold, quantity)
+    inventory.extend(itemprototypes.make_item(item_id) for _ in range(bought))
+    return bought, player_gold
+
 def visit_shop(player_gold, inventory):
     """
-    Displays the shop interface, allows the player to purchase an item if they have enough gold,
-    and updates the inventory and gold accordingly.
+    Displays the shop interface, allows the player to purchase one or more of an item if they
+    have enough gold, and updates the inventory and gold accordingly.
 
     Args:
         player_gold (float): The player's current gold.
@@ -158,13 +273,10 @@ def visit_shop(player_gold, inventory):
     Returns:
         tuple: (float) Updated player gold, (list) Updated inventory.
     """
-    items_for_sale = [
-        {"name": "sword", "type": "weapon", "maxDurability": 5, "currentDurability": 5, "price": 10},
-        {"name": "shield", "type": "armor", "maxDurability": 5, "currentDurability": 5, "price": 8},
-        {"name": "holy hand grenade", "type": "consumable", "note": "defeats monster", "price": 12}
-    ]
+    items_for_sale, _ = load_shop_catalog()
 
-    print("\nWelcome to the shop!")
+    screen = TextScreen()
+    screen.add("\nWelcome to the shop!")
 
     # Build formatted lines for each item
     item_lines = []
@@ -179,13 +291,14 @@ def visit_shop(player_gold, inventory):
     bottom = f"\\{'-' * (content_width - 2)}/"
 
     # Print box
-    print(border)
+    screen.add(border)
     for line in item_lines:
-        print(line)
-    print(bottom)
+        screen.add(line)
+    screen.add(bottom)
 
     # Add option to leave shop
-    print(f"{len(items_for_sale)+1}) Leave shop")
+    screen.add(f"{len(items_for_sale)+1}) Leave shop")
+    screen.flush()
 
     choice = input("Enter your choice: ")
 
@@ -197,12 +310,22 @@ def visit_shop(player_gold, inventory):
         return player_gold, inventory
 
     selected_item = items_for_sale[int(choice)-1]
-    if player_gold >= selected_item["price"]:
-        inventory.append(selected_item.copy())
-        player_gold -= selected_item["price"]
+    quantity = input("How many? (default 1): ").strip() or "1"
+    if not quantity.isdigit() or int(quantity) < 1:
+        print("Invalid quantity.")
+        return player_gold, inventory
+
+    bought, player_gold = buy_items(selected_item["id"], int(quantity), player_gold, inventory)
+    eventbus.publish("item_purchased", item=selected_item["id"], requested=int(quantity), bought=bought,
+                     cost=bought * selected_item["price"], gold=player_gold)
+    if bought <= 0:
+        print("Not enough gold!")
+    elif bought == 1:
         print(f"You bought a {selected_item['name']}!")
     else:
-        print("Not enough gold!")
+        print(f"You bought {bought} {selected_item['name']}s!")
+    if 0 < bought < int(quantity):
+        print("You couldn't afford the rest.")
 
     return player_gold, inventory
 
@@ -265,35 +388,22 @@ def handle_equipment(inventory, equipped_weapon, equipped_armor):
 def new_random_monster() -> dict:
     """
     Generates a random monster with a name, description, health, power, and money.
+    The monster type is picked by spawn weight from the template table in monsters.json.
 
     Returns:
         dict: A dictionary containing the monster's name, description, health, power, and money reward.
     """
-    monsters = [
-        {
-            "name": "Pixie",
-            "description": "You find a sparkling little creature buzzing around. When it notices you, it rushes at you quickly with a sharp dagger.",
-            "health": random.randint(10, 20),
-            "power": random.randint(5, 10),
-            "money": round(random.uniform(1, 15), 2),
-        },
-        {
-            "name": "Frog",
-            "description": "You discover a frog licking its lips as it looks you over.",
-            "health": random.randint(5, 15),
-            "power": random.randint(2, 7),
-            "money": round(random.uniform(1, 10), 2),
-        },
-        {
-            "name": "Vampire",
-            "description": "A shadowy figure jumps out at you from behind a tree.",
-            "health": random.randint(30, 50),
-            "power": random.randint(10, 20),
-            "money": round(random.uniform(5, 30), 2),
-        }
-    ]
-
-    return random.choice(monsters)
+    return monstertemplates.roll_monster()
+
+INGREDIENT_DROPS = {
+    "Vampire": "vial of blood",
+    "Pixie": "bag of pixie dust",
+    "Frog": "jar of warts"
+}
+
+for _drop_name in INGREDIENT_DROPS.values():
+    itemprototypes.register_item_prototype(
+        {"id": itemprototypes.item_id_for(_drop_name), "name": _drop_name, "type": "ingredient"})
 
 def combat_loop(player_hp, monster, player_gold, weapon, inventory):
     """
@@ -316,14 +426,16 @@ def combat_loop(player_hp, monster, player_gold, weapon, inventory):
     monster['health'] = monster_hp
     monster_power = monster['power']
     monster_money = monster['money']
+    screen = TextScreen()
 
     while monster_hp > 0 and player_hp > 0:
-        print(f"\nYour HP: {player_hp} | {monster['name']} HP: {monster_hp}")
+        screen.add(f"\nYour HP: {player_hp} | {monster['name']} HP: {monster_hp}")
         potions = [item for item in inventory if item["type"] == "consumable"]
         if potions:
-            print("You have potions available:")
+            screen.add("You have potions available:")
             for i, p in enumerate(potions, 1):
-                print(f"{i}) {p['name'].title()}")
+                screen.add(f"{i}) {p['name'].title()}")
+            screen.flush()
 
             use = input("Use a potion? (y/n): ").lower()
             if use == "y":
@@ -331,6 +443,7 @@ def combat_loop(player_hp, monster, player_gold, weapon, inventory):
                     choice = int(input("Choose potion by number: ")) - 1
                     potion = potions[choice]
 
+                    eventbus.publish("potion_used", potion=potion["name"], effect=potion["effect"])
                     if potion["effect"] == "heal":
                         healed = 15
                         player_hp = min(player_hp + healed, 30)
@@ -347,43 +460,43 @@ def combat_loop(player_hp, monster, player_gold, weapon, inventory):
                 except (IndexError, ValueError):
                     print("Invalid choice.")
 
-        print("1) Attack")
-        print("2) Run Away")
+        screen.add("1) Attack")
+        screen.add("2) Run Away")
+        screen.flush()
         choice = input("Enter choice (1-2): ")
 
         if choice == "2":
+            eventbus.publish("combat_fled", monster=monster["name"], player_hp=player_hp, monster_hp=monster_hp)
             print("You ran away and returned to the map.")
             return player_hp, player_gold, weapon
 
         if weapon:
-            damage = random.randint(10, 20)
+            damage = rng.randint(10, 20)
             weapon["currentDurability"] -= 1
             if weapon["currentDurability"] <= 0:
                 print(f"Your {weapon['name']} broke!")
+                eventbus.publish("item_broken", item=weapon["name"])
                 inventory.remove(weapon)
                 weapon = None
         else:
-            damage = random.randint(5, 10)
+            damage = rng.randint(5, 10)
 
         monster_hp -= damage
         print(f"You hit the {monster['name']} for {damage} damage!")
+        eventbus.publish("combat_hit", attacker="player", target=monster["name"], damage=damage, target_hp=monster_hp)
         monster['health'] = monster_hp
 
         if monster_hp <= 0:
             print(f"You defeated the {monster['name']} and earned {monster_money:.2f} gold!")
             player_gold += monster_money
+            eventbus.publish("monster_defeated", monster=monster["name"], gold=monster_money, auto=False)
 
-            ingredient_drops = {
-                "Vampire": "vial of blood",
-                "Pixie": "bag of pixie dust",
-                "Frog": "jar of warts"
-            }
-
-            drop_name = ingredient_drops.get(monster["name"])
+            drop_name = INGREDIENT_DROPS.get(monster["name"])
             if drop_name:
-                loot = {"name": drop_name, "type": "ingredient"}
+                loot = itemprototypes.make_item(itemprototypes.item_id_for(drop_name))
                 inventory.append(loot)
                 print(f"You found a {drop_name} on the {monster['name']}!")
+                eventbus.publish("item_dropped", item=drop_name, monster=monster["name"])
 
         damage_taken = monster_power
 
@@ -395,18 +508,89 @@ def combat_loop(player_hp, monster, player_gold, weapon, inventory):
             armor["currentDurability"] -= 1
             if armor["currentDurability"] <= 0:
                 print(f"Your {armor['name']} broke!")
+                eventbus.publish("item_broken", item=armor["name"])
                 inventory.remove(armor)
 
         player_hp -= damage_taken
         print(f"The {monster['name']} hit you for {damage_taken} damage!")
+        eventbus.publish("combat_hit", attacker=monster["name"], target="player", damage=damage_taken,
+                         target_hp=player_hp, blocked=armor is not None)
 
         if player_hp <= 0:
             print("You have been defeated by the monster!")
+            eventbus.publish("player_defeated", monster=monster["name"], auto=False)
             return "revive", player_gold, weapon
             break
 
     return player_hp, player_gold, weapon
 
+def auto_resolve_fight(player_hp, monster, player_gold, weapon, inventory):
+    """
+    Resolves a fight in one step using the exact outcome distribution from autoresolve.
+    Shows the win chance and expected gold, then applies one sampled result. Potions are
+    not used and the player never runs away.
+
+    Args:
+        player_hp (int): The player's current HP.
+        monster (dict): Dictionary representing the monster's stats and description.
+        player_gold (float): The player's current amount of gold.
+        weapon (dict or None): The currently equipped weapon (if any).
+        inventory (list): The player's inventory containing items.
+
+    Returns:
+        tuple: Same as combat_loop; "revive" replaces the HP if the player was defeated.
+    """
+    weapon_dur = weapon["currentDurability"] if weapon else 0
+    armors = [item for item in inventory if item["type"] == "armor"]
+    armor_dur = sum(item["currentDurability"] for item in armors)
+
+    summary = autoresolve.fight_summary(player_hp, monster["health"], weapon_dur, armor_dur,
+                                        monster["power"], monster["money"])
+    print(f"Win chance: {summary['win'] * 100:.1f}% | Expected gold: {summary['expected_gold']:.2f}")
+
+    end_hp, end_monster_hp, end_weapon_dur, end_armor_dur = autoresolve.sample_outcome(
+        player_hp, monster["health"], weapon_dur, armor_dur, monster["power"])
+
+    if weapon:
+        weapon["currentDurability"] = end_weapon_dur
+        if end_weapon_dur <= 0:
+            print(f"Your {weapon['name']} broke!")
+            eventbus.publish("item_broken", item=weapon["name"])
+            inventory.remove(weapon)
+            weapon = None
+
+    # Armor wears out in inventory order, like in combat_loop
+    armor_used = armor_dur - end_armor_dur
+    for armor in armors:
+        if armor_used <= 0:
+            break
+        wear = min(armor_used, armor["currentDurability"])
+        armor["currentDurability"] -= wear
+        armor_used -= wear
+        if armor["currentDurability"] <= 0:
+            print(f"Your {armor['name']} broke!")
+            eventbus.publish("item_broken", item=armor["name"])
+            inventory.remove(armor)
+
+    monster["health"] = end_monster_hp
+    if end_monster_hp <= 0:
+        print(f"You defeated the {monster['name']} and earned {monster['money']:.2f} gold!")
+        player_gold += monster["money"]
+        eventbus.publish("monster_defeated", monster=monster["name"], gold=monster["money"], auto=True)
+        drop_name = INGREDIENT_DROPS.get(monster["name"])
+        if drop_name:
+            inventory.append(itemprototypes.make_item(itemprototypes.item_id_for(drop_name)))
+            print(f"You found a {drop_name} on the {monster['name']}!")
+            eventbus.publish("item_dropped", item=drop_name, monster=monster["name"])
+
+    if end_hp <= 0:
+        print("You have been defeated by the monster!")
+        eventbus.publish("player_defeated", monster=monster["name"], auto=True)
+        return "revive", player_gold, weapon
+
+    print(f"You finished the fight with {end_hp} HP.")
+    return end_hp, player_gold, weapon
+
 def handle_monster_fight(player_hp, player_gold, inventory, equipped_weapon):
     """
     Initiates a monster encounter. Allows the player to either use a consumable item to defeat
@@ -446,6 +630,9 @@ def handle_monster_fight(player_hp, player_gold, inventory, equipped_weapon):
 
     return result
 
+REVIVE_HP = 10
+DOCTOR_FEE = 10
+
 def handle_revive(player_gold, doctor_visits):
     """
     Handles revival after defeat, including doctor rescue logic and gold deduction.
@@ -461,16 +648,18 @@ def handle_revive(player_gold, doctor_visits):
             - (int) updated doctor_visits
     """
     doctor_visits += 1
-    player_hp = 10
+    player_hp = REVIVE_HP
 
     if doctor_visits == 1:
         print("\nA stranger finds you unconscious and brings you to a doctor.")
-        print("The doctor patches you up for free. You're restored to 10 HP.")
+        print(f"The doctor patches you up for free. You're restored to {REVIVE_HP} HP.")
     else:
-        player_gold -= 10
-        print("\nOnce again, the doctor finds you... but this time, it costs you 10 gold.")
+        player_gold -= DOCTOR_FEE
+        print(f"\nOnce again, the doctor finds you... but this time, it costs you {DOCTOR_FEE} gold.")
         print(f"Your new gold balance is: {player_gold:.2f}")
 
+    eventbus.publish("player_revived", visit=doctor_visits, fee=0 if doctor_visits == 1 else DOCTOR_FEE,
+                     hp=player_hp, gold=player_gold)
     return player_hp, player_gold, doctor_visits
 
 def handle_adventure(player_hp, player_gold, inventory, equipped_weapon, doctor_visits):
@@ -502,17 +691,60 @@ def handle_adventure(player_hp, player_gold, inventory, equipped_weapon, doctor_
 
     return player_hp, player_gold, equipped_weapon, doctor_visits
 
-def handle_adventure_with_monster(player_hp, player_gold, inventory, equipped_weapon, doctor_visits, monster_data):
+def record_monster_fight(monster_data, encounter=None):
+    """
+    Persists the result of a map fight: a defeated monster is removed and its region
+    queues a respawn, a surviving monster keeps its damage.
+
+    The world may have changed while the player was in the fight (another process can
+    move monsters), so the result is only recorded if the monster on the tile is still
+    the one that was fought. Otherwise nothing is written.
+
+    Args:
+        monster_data (dict): The monster after the fight.
+        encounter (dict, optional): The monster as it was when the fight started. Defaults
+            to monster_data, which only checks that a monster of that name is on the tile.
+
+    Returns:
+        bool: True if the fight was recorded, False if the monster had moved on.
+    """
+    encounter = encounter or monster_data
+    with worldlog.transaction() as (state, index):
+        current = index.get(monster_data["pos"])
+        if (current is None or current["name"] != encounter["name"]
+                or (encounter is not monster_data and current["health"] != encounter["health"])):
+            print(f"The {encounter['name']} slipped away before the fight could be recorded.")
+            return False
+
+        if monster_data['health'] <= 0:
+            worldlog.append_event("monster_removed", pos=monster_data["pos"])
+            manager = world_population(state, index)
+            manager.schedule_respawn(monster_data["pos"], time.time(), worldlog.append_event)
+        else:
+            worldlog.append_event("monster_damaged", pos=monster_data["pos"],
+                                  health=monster_data["health"])
+    return True
+
+def handle_adventure_with_monster(player_hp, player_gold, inventory, equipped_weapon, doctor_visits, monster_data,
+                                  record_fight=record_monster_fight):
     """
     Handles combat using a specific monster passed from the map.
 
+    Args:
+        record_fight (callable, optional): Called with the monster after a fight the player
+            survives, to persist it. Defaults to record_monster_fight (the local world log).
+
     Returns:
         Updated player state after combat.
     """
     print(f"\nYou encountered a {monster_data['name']} on the map!")
-    print(monster_data.get("description"))
+    print(monster_description(monster_data))
 
-    result = combat_loop(player_hp, monster_data, player_gold, equipped_weapon, inventory)
+    auto = input("Auto-resolve this fight? (y/n): ").lower()
+    if auto == "y":
+        result = auto_resolve_fight(player_hp, monster_data, player_gold, equipped_weapon, inventory)
+    else:
+        result = combat_loop(player_hp, monster_data, player_gold, equipped_weapon, inventory)
 
     if result[0] == "revive":
         player_gold = result[1]
@@ -521,14 +753,13 @@ def handle_adventure_with_monster(player_hp, player_gold, inventory, equipped_we
 
     elif isinstance(result[0], int):
         player_hp, player_gold, equipped_weapon = result
-        if monster_data['health'] <= 0:
-            state = get_persistent_map_state()
-            state["monsters"] = [m for m in state["monsters"] if m["pos"] != monster_data["pos"]]
-            with open(MAP_STATE_FILE, "w") as f:
-                json.dump(state, f)
+        record_fight(monster_data)
 
     return player_hp, player_gold, equipped_weapon, doctor_visits
 
+SLEEP_COST = 5
+SLEEP_HEAL = 10
+
 def sleep(player_hp, player_gold, max_hp):
     """
     Restores the player's HP by a set amount in exchange for gold.
@@ -541,8 +772,8 @@ def sleep(player_hp, player_gold, max_hp):
     Returns:
         tuple: Updated player_hp and player_gold after sleeping.
     """
-    cost = 5
-    heal_amount = 10
+    cost = SLEEP_COST
+    heal_amount = SLEEP_HEAL
 
     if player_gold < cost:
         print("Not enough gold to sleep at the Inn.")
@@ -553,9 +784,17 @@ def sleep(player_hp, player_gold, max_hp):
     print(f"You slept at an Inn and recovered {heal_amount} HP. Current HP: {player_hp}, Gold left: {player_gold:.2f}")
     return player_hp, player_gold
 
+# Which save file section each field goes in; anything else goes with the player stats
+SAVE_SECTIONS = {
+    "player_inventory": "inventory",
+    "equipped_weapon": "equipment",
+    "equipped_armor": "equipment",
+}
+
 def save_game(filename: str, game_data: dict) -> None:
     """
-    Saves the game state to a JSON file.
+    Saves the game state to a save file split into player, inventory and equipment
+    sections, so loading can read just the part it needs.
 
     Args:
         filename (str): The name of the file to save to.
@@ -564,26 +803,28 @@ def save_game(filename: str, game_data: dict) -> None:
     Returns:
         None
     """
+    sections = {"player": {}}
+    for field, value in game_data.items():
+        sections.setdefault(SAVE_SECTIONS.get(field, "player"), {})[field] = value
     try:
-        with open(filename, 'w') as f:
-            json.dump(game_data, f, indent=4)
+        savefile.write_save(filename, sections)
         print(f"Game saved to {filename}!")
     except Exception as e:
         print(f"Error saving game: {e}")
 
-def load_game(filename: str) -> dict:
+def load_game(filename: str) -> savefile.SaveFile:
     """
-    Loads the game state from a JSON file.
+    Opens a save file. Only its header is read here; each section is decoded the first
+    time one of its fields is read with get(). Older single-JSON saves are read in full.
 
     Args:
         filename (str): The name of the file to load.
 
     Returns:
-        dict or None: Loaded game data if successful, or None if loading fails.
+        SaveFile or None: The save, read like a dict with get(), or None if loading fails.
     """
     try:
-        with open(filename, 'r') as f:
-            game_data = json.load(f)
+        game_data = savefile.SaveFile(filename)
         print(f"Game loaded from {filename}!")
         return game_data
     except FileNotFoundError:
@@ -592,13 +833,60 @@ def load_game(filename: str) -> dict:
         print(f"Error loading game: {e}")
     return None
 
+def load_saved_gear(saved_game):
+    """
+    Decodes the inventory and equipped items of the save returned by start_game.
+    start_game leaves these out so the town menu can open without them.
+
+    Args:
+        saved_game (SaveFile or None): The resumed save, or None for a new game.
+
+    Returns:
+        tuple: (list) inventory, (Item or None) equipped weapon, (Item or None) equipped armor.
+    """
+    if saved_game is None:
+        return [], None, None
+
+    load_shop_catalog()
+    inventory = [itemprototypes.item_from_save(item) for item in saved_game.get("player_inventory", [])]
+    weapon = find_equipped_item(inventory, saved_game.get("equipped_weapon"))
+    armor = find_equipped_item(inventory, saved_game.get("equipped_armor"))
+    saved_game.close()  # every section the game needs has now been read
+    return inventory, weapon, armor
+
+def find_equipped_item(inventory, saved_item):
+    """
+    Finds the inventory item that a saved equipped item refers to, so equipping,
+    wearing down and breaking it all act on the same item.
+
+    Args:
+        inventory (list): The loaded inventory.
+        saved_item (dict or None): The saved equipped item, compact or from an older save.
+
+    Returns:
+        Item or None: The matching inventory item, or None if nothing was equipped or the
+            equipped item had already broken and left the inventory.
+    """
+    if not saved_item:
+        return None
+    item = itemprototypes.item_from_save(saved_item)
+    if item.currentDurability is not None and item.currentDurability <= 0:
+        return None
+    for candidate in inventory:
+        if candidate.prototype is item.prototype and candidate.currentDurability == item.currentDurability:
+            return candidate
+    return None
+
 def start_game(filename="savefile.json"):
     """
     Handles game start logic, prompting the user to load or start new.
-    Returns initialized game state.
+    Returns initialized game state. When resuming a save only the player stats are
+    decoded; the inventory and equipment stay in the returned save until
+    load_saved_gear(saved_game) is called.
 
     Returns:
-        tuple: (player_name, player_hp, player_gold, max_hp, player_inventory, equipped_weapon, equipped_armor, doctor_visits)
+        tuple: (player_name, player_hp, player_gold, max_hp, doctor_visits, saved_game),
+            where saved_game is the resumed SaveFile, or None for a new game.
     """
     print("Welcome to the Adventure Game!")
     print("1) Start New Game")
@@ -617,10 +905,8 @@ def start_game(filename="savefile.json"):
                 data.get("player_hp", 30),
                 data.get("player_gold", 10),
                 data.get("max_hp", 30),
-                data.get("player_inventory", []),
-                data.get("equipped_weapon"),
-                data.get("equipped_armor"),
-                data.get("doctor_visits", 0)
+                data.get("doctor_visits", 0),
+                data  # inventory and equipment, see load_saved_gear
             )
         else:
             print("Failed to load. Starting a new game...")
@@ -633,10 +919,8 @@ def start_game(filename="savefile.json"):
         30,  # player_hp
         10,  # player_gold
         30,  # max_hp
-        [],  # inventory
-        None,  # equipped_weapon
-        None,  # equipped_armor
-        0    # doctor_visits
+        0,   # doctor_visits
+        None  # no save to load gear from
         )
 
 def save_and_quit(filename, player_name, player_hp, player_gold, max_hp, inventory, weapon, armor, doctor_visits):
@@ -662,36 +946,25 @@ def save_and_quit(filename, player_name, player_hp, player_gold, max_hp, invento
         "player_hp": player_hp,
         "player_gold": player_gold,
         "max_hp": max_hp,
-        "player_inventory": inventory,
-        "equipped_weapon": weapon,
-        "equipped_armor": armor,
+        "player_inventory": [itemprototypes.item_to_save(item) for item in inventory],
+        "equipped_weapon": itemprototypes.item_to_save(weapon) if weapon else None,
+        "equipped_armor": itemprototypes.item_to_save(armor) if armor else None,
         "doctor_visits": doctor_visits
     }
     save_game(filename, game_data)
     print("Game saved. Goodbye!")
 
-MAP_STATE_FILE = "map_state.json"
+MAP_STATE_FILE = worldlog.SNAPSHOT_FILE
 
 def get_persistent_map_state():
     """
     Loads or initializes the persistent map state with fixed monster/town positions.
+    The state is rebuilt from the latest snapshot plus the world event log.
 
     Returns:
         dict: Dictionary with player position, town position, monster position.
     """
-    if os.path.exists(MAP_STATE_FILE):
-        with open(MAP_STATE_FILE, 'r') as f:
-            return json.load(f)
-    else:
-        # Default map state
-        state = {
-            "player_pos": [5, 5],
-            "town_pos": [5, 5],
-            "monsters": []
-        }
-        with open(MAP_STATE_FILE, 'w') as f:
-            json.dump(state, f)
-        return state
+    return worldlog.load_world_state()
     
 def save_map_state(player_pos):
     """
@@ -703,39 +976,38 @@ def save_map_state(player_pos):
     Returns:
         None
     """
-    state = get_persistent_map_state()
-    state["player_pos"] = player_pos
-    with open(MAP_STATE_FILE, 'w') as f:
-        json.dump(state, f)
+    worldlog.append_event("player_moved", pos=list(player_pos))
 
-def launch_map(player_pos, town_pos):
+TILE_SIZE = 32
+GRID_SIZE = 10
+VIEW_SIZE = 10  # tiles shown across the window; the world can be bigger
+
+def load_map_images(tile_size=TILE_SIZE):
     """
-    Launches a graphical 10x10 grid using Pygame where the player can move and encounter events.
+    Loads the player and monster sprites, scaled to the tile size. Sprites come from the
+    pre-scaled atlas built by spriteatlas.py when it has this tile size, otherwise each PNG
+    in the images folder is loaded and scaled.
 
     Args:
-        player_pos (list): Current [x, y] grid coordinates.
-        monster_pos (list): Monster [x, y] location.
-        town_pos (list): Town [x, y] location.
+        tile_size (int, optional): Width and height in pixels of one map tile. Defaults to TILE_SIZE.
 
     Returns:
-        str: "monster", "town", or "exit"
+        tuple: (pygame.Surface or None) player image, (dict) monster name -> image or None.
     """
-    pygame.init()
-    state = get_persistent_map_state()
-
-    TILE_SIZE = 32
-    GRID_SIZE = 10
-    WIDTH, HEIGHT = TILE_SIZE * GRID_SIZE, TILE_SIZE * GRID_SIZE
-
-    print("Opening map...")
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("Adventure Map")
-
-    clock = pygame.time.Clock()
+    if os.path.exists(spriteatlas.ATLAS_FILE):
+        try:
+            atlas, sprite_table = spriteatlas.load_atlas()
+            sprites = spriteatlas.atlas_sprites(atlas, sprite_table, tile_size)
+            if sprites is not None:
+                player_image = sprites.pop("player", None)
+                monster_images = {name.capitalize(): image for name, image in sprites.items()}
+                return player_image, monster_images
+        except Exception as e:
+            print(f"Failed to load sprite atlas: {e}")
 
     try:
         player_image = pygame.transform.scale(
-            pygame.image.load('images/player.png'), (32, 32))
+            pygame.image.load('images/player.png'), (tile_size, tile_size))
     except Exception as e:
         print(f"Failed to load player image: {e}")
         player_image = None
@@ -744,118 +1016,318 @@ def launch_map(player_pos, town_pos):
     for name in ["Vampire", "Frog", "Pixie"]:
         try:
             monster_images[name] = pygame.transform.scale(
-                pygame.image.load(f'images/{name.lower()}.png'), (32, 32))
+                pygame.image.load(f'images/{name.lower()}.png'), (tile_size, tile_size))
         except Exception as e:
             print(f"Failed to load monster image for {name}: {e}")
             monster_images[name] = None
 
+    return player_image, monster_images
+
+def move_player(key, player_pos, grid_size=GRID_SIZE):
+    """
+    Moves the player one tile in the direction of an arrow key, staying inside the grid.
+
+    Args:
+        key (int): The pygame key code that was pressed.
+        player_pos (list): Current [x, y] grid coordinates, updated in place.
+        grid_size (int, optional): Number of tiles along each side of the map. Defaults to GRID_SIZE.
+
+    Returns:
+        list: The updated player position.
+    """
+    if key == pygame.K_UP and player_pos[1] > 0:
+        player_pos[1] -= 1
+    elif key == pygame.K_DOWN and player_pos[1] < grid_size - 1:
+        player_pos[1] += 1
+    elif key == pygame.K_LEFT and player_pos[0] > 0:
+        player_pos[0] -= 1
+    elif key == pygame.K_RIGHT and player_pos[0] < grid_size - 1:
+        player_pos[0] += 1
+    return player_pos
+
+def move_map_monsters(state, player_pos, monster_index=None):
+    """
+    Moves every wandering monster on the map one step, avoiding each other, the player and the town.
+    Monsters are updated in place, so a tick doesn't build new lists or dictionaries.
+
+    Args:
+        state (dict): The map state; each monster's "pos" in its "monsters" list is updated.
+        player_pos (list): Current [x, y] grid coordinates of the player.
+        monster_index (MonsterIndex, optional): Position index over state["monsters"],
+            kept in sync as monsters move. One is built if not given.
+
+    Returns:
+        MonsterIndex: The position index over the moved monsters.
+    """
+    if monster_index is None:
+        monster_index = MonsterIndex(state["monsters"])
+
+    # The index's slots are keyed by every monster's tile, so they double as the occupied set
+    occupied = monster_index.slots
+    blocked = (tuple(player_pos), tuple(state["town_pos"]))
+    monsters = state["monsters"]
+    orders = rng.randranges(len(DIRECTION_ORDERS), len(monsters))
+
+    for m, order in zip(monsters, orders):
+        new_pos = WanderingMonster.next_position(m["pos"], occupied, blocked, GRID_SIZE, order)
+        if new_pos is not None:
+            monster_index.move(m, new_pos)
+
+    return monster_index
+
+def remember_positions(previous_positions, monsters):
+    """
+    Copies each monster's position into a reusable list, for drawing between ticks.
+
+    Args:
+        previous_positions (list): [x, y] lists to overwrite, one per monster.
+        monsters (list): The monsters whose positions to copy.
+
+    Returns:
+        list: previous_positions, or a new list if the number of monsters changed.
+    """
+    if len(previous_positions) != len(monsters):
+        return [list(m["pos"]) for m in monsters]
+    for previous, m in zip(previous_positions, monsters):
+        previous[0], previous[1] = m["pos"]
+    return previous_positions
+
+def monster_description(monster):
+    """
+    Returns a monster's description, which is stored once per monster type in its template.
+
+    Args:
+        monster (dict): A monster record with at least a "name".
+
+    Returns:
+        str: The description, or an empty string if the monster type is unknown.
+    """
+    template = monstertemplates.get_monster_template(monster["name"])
+    if template is not None:
+        return template["description"]
+    return monster.get("description", "")
+
+def draw_map(screen, state, player_pos, town_pos, player_image, monster_images,
+             tile_size=TILE_SIZE, grid_size=GRID_SIZE, previous_positions=None, alpha=1.0,
+             camera=None, monster_index=None):
+    """
+    Draws one frame of the map (grid, monsters, town and player) onto a surface.
+    Only the tiles and monsters inside the camera's view are drawn.
+
+    Args:
+        screen (pygame.Surface): The surface to draw on; a window or an offscreen surface.
+        state (dict): The map state containing the monsters list.
+        player_pos (list): Player [x, y] grid coordinates.
+        town_pos (list): Town [x, y] grid coordinates.
+        player_image (pygame.Surface or None): Player sprite, or None to draw a blue square.
+        monster_images (dict): Monster name -> sprite, or None to draw a red square.
+        tile_size (int, optional): Width and height in pixels of one tile. Defaults to TILE_SIZE.
+        grid_size (int, optional): Number of tiles along each side of the map. Defaults to GRID_SIZE.
+        previous_positions (list, optional): Each monster's position before its last move,
+            in the same order as state["monsters"].
+        alpha (float, optional): How far between the previous and current positions to draw
+            monsters, from 0.0 to 1.0. Defaults to 1.0 (current positions).
+        camera (Camera, optional): The view to draw. Defaults to one showing the whole grid.
+        monster_index (MonsterIndex, optional): Position index over state["monsters"], used
+            to find the monsters in view. One is built if not given.
+
+    Returns:
+        None
+    """
+    if camera is None:
+        camera = Camera(grid_size, grid_size, grid_size, grid_size, tile_size)
+    if monster_index is None:
+        monster_index = MonsterIndex(state.get("monsters", []))
+
+    screen.fill((0, 0, 0))  # Clear screen
+
+    left, top, right, bottom = camera.visible_bounds()
+    for row in range(top, bottom):
+        for col in range(left, right):
+            x, y = camera.to_screen(col, row)
+            rect = pygame.Rect(x, y, tile_size, tile_size)
+            pygame.draw.rect(screen, (200, 200, 200), rect, 1)  # draw grid border
+
+    # Draw monsters, including ones just off screen that may be sliding into view
+    for i, m in monster_index.query_rect(*camera.visible_bounds(margin=1)):
+        monster_name = m["name"].capitalize()
+        x, y = m["pos"]
+        if previous_positions and i < len(previous_positions) and alpha < 1.0:
+            old_x, old_y = previous_positions[i]
+            x = old_x + (x - old_x) * alpha
+            y = old_y + (y - old_y) * alpha
+        monster_pos = camera.to_screen(x, y)
+
+        if monster_name in monster_images and monster_images[monster_name]:
+            screen.blit(monster_images[monster_name], monster_pos)
+        else:
+            monster_rect = pygame.Rect(
+                monster_pos[0], monster_pos[1], tile_size, tile_size)
+            pygame.draw.rect(screen, (255, 0, 0), monster_rect)
+
+    # Draw town
+    if camera.is_visible(town_pos):
+        town_x, town_y = camera.to_screen(town_pos[0], town_pos[1])
+        pygame.draw.circle(
+            screen, (0, 255, 0),
+            (town_x + tile_size // 2, town_y + tile_size // 2),
+            tile_size // 3
+        )
+
+    # Draw player
+    player_x, player_y = camera.to_screen(player_pos[0], player_pos[1])
+    if player_image:
+        screen.blit(player_image, (player_x, player_y))
+    else:
+        player_rect = pygame.Rect(player_x, player_y, tile_size, tile_size)
+        pygame.draw.rect(screen, (0, 0, 255), player_rect)
+
+MONSTER_MOVE_TICKS = 10  # monsters step once a second at the default tick rate
+PERSIST_TICKS = 10
+
+def monster_move_alpha(scheduler):
+    """
+    Returns how far the monsters are through their current move, for draw_map. Monsters
+    only step every MONSTER_MOVE_TICKS ticks, so the slide is spread over that whole
+    interval rather than restarting on every tick.
+
+    Args:
+        scheduler (WorldScheduler): The scheduler that runs the move_monsters task.
+
+    Returns:
+        float: 0.0 right after a move, up to 1.0 just before the next one.
+    """
+    ticks_since_move = scheduler.tick_count % MONSTER_MOVE_TICKS
+    return min((ticks_since_move + scheduler.alpha) / MONSTER_MOVE_TICKS, 1.0)
+
+def persist_monster_positions(state, world):
+    """
+    Logs the monsters' current positions if they moved since they were last saved.
+    The write only goes through if nothing else changed the world since this map
+    last synced with it; otherwise the local moves are dropped and the map reloads
+    the world, so a stale monster list never overwrites another process's changes.
+
+    Args:
+        state (dict): The map state being played, reloaded in place on a conflict.
+        world (dict): The map's runtime data with "dirty", "seq" and "index".
+
+    Returns:
+        None
+    """
+    if not world["dirty"]:
+        return
+    world["dirty"] = False
+    try:
+        event = worldlog.append_event("monsters_moved", expected_seq=world["seq"],
+                                      positions=[m["pos"] for m in state["monsters"]])
+        world["seq"] = event["seq"]
+    except worldlog.WorldConflictError:
+        state.update(get_persistent_map_state())
+        world["index"].reset(state["monsters"])
+        world["previous_positions"] = [list(m["pos"]) for m in state["monsters"]]
+        world["seq"] = state["seq"]
+
+def create_world_scheduler(state, player_pos, world):
+    """
+    Builds the fixed-timestep scheduler that moves monsters and saves their positions.
+    Monster movement always runs; saving is low priority and may slip to a later tick.
+
+    Args:
+        state (dict): The map state being played.
+        player_pos (list): The player's [x, y] position, updated in place by key presses.
+        world (dict): The map's runtime data: "index" (MonsterIndex), "previous_positions"
+            (list), "dirty" (bool) and "seq" (int, the world event the map last synced with).
+            Updated in place by the tasks.
+
+    Returns:
+        WorldScheduler: The scheduler with its tasks added.
+    """
+    def move_monsters():
+        world["previous_positions"] = remember_positions(world["previous_positions"], state["monsters"])
+        move_map_monsters(state, player_pos, world["index"])
+        world["dirty"] = True
+
+    scheduler = WorldScheduler()
+    scheduler.add_task("move_monsters", move_monsters, priority=0, every=MONSTER_MOVE_TICKS)
+    scheduler.add_task("persist_monsters", lambda: persist_monster_positions(state, world),
+                       priority=1, every=PERSIST_TICKS)
+    return scheduler
+
+def launch_map(player_pos, town_pos):
+    """
+    Launches a graphical grid using Pygame where the player can move and encounter events.
+    The window shows VIEW_SIZE x VIEW_SIZE tiles and scrolls to follow the player.
+
+    Args:
+        player_pos (list): Current [x, y] grid coordinates.
+        town_pos (list): Town [x, y] location.
+
+    Returns:
+        str: "monster", "town", or "exit"
+    """
+    pygame.init()
+    state = get_persistent_map_state()
+
+    camera = Camera(VIEW_SIZE, VIEW_SIZE, GRID_SIZE, GRID_SIZE, TILE_SIZE)
+
+    print("Opening map...")
+    screen = pygame.display.set_mode(camera.pixel_size)
+    pygame.display.set_caption("Adventure Map")
+
+    clock = pygame.time.Clock()
+
+    player_image, monster_images = load_map_images()
+    world = {
+        "index": MonsterIndex(state["monsters"]),
+        "previous_positions": [list(m["pos"]) for m in state["monsters"]],
+        "dirty": False,
+        "seq": state["seq"],
+    }
+    scheduler = create_world_scheduler(state, player_pos, world)
+
+    def leave_map(result):
+        if result == "exit":
+            eventbus.publish("map_exited", pos=list(player_pos))
+        elif result["type"] == "monster":
+            eventbus.publish("map_encounter", monster=result["monster"]["name"], pos=list(player_pos),
+                             monster_hp=result["monster"]["health"])
+        else:
+            eventbus.publish("map_reached_town", pos=list(player_pos))
+        persist_monster_positions(state, world)
+        save_map_state(player_pos)
+        pygame.quit()
+        return result
+
     running = True
-    player_move_count = 0
+    elapsed = 0.0
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                save_map_state(player_pos)
-                pygame.quit()
-                return "exit"
+                return leave_map("exit")
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_x:
-                    save_map_state(player_pos)
-                    pygame.quit()
-                    return "exit"
-                elif event.key == pygame.K_UP and player_pos[1] > 0:
-                    player_pos[1] -= 1
-                elif event.key == pygame.K_DOWN and player_pos[1] < 9:
-                    player_pos[1] += 1
-                elif event.key == pygame.K_LEFT and player_pos[0] > 0:
-                    player_pos[0] -= 1
-                elif event.key == pygame.K_RIGHT and player_pos[0] < 9:
-                    player_pos[0] += 1
-                
-                player_move_count += 1
-                if player_move_count % 2 == 0:
-                    # Move monsters
-                    updated_monsters = []
-                    original_monsters = state["monsters"][:]
-                    occupied_positions = [m["pos"] for m in original_monsters]
-                    occupied_positions.append(player_pos)
-
-                    for m in original_monsters:
-                        monster = WanderingMonster(pos=m["pos"])
-                        monster.name = m["name"]
-                        monster.color = list(WanderingMonster.COLORS.get(monster.name, (255, 255, 255)))
-
-                        monster.health = m["health"]
-                        monster.power = m["power"]
-                        monster.money = m["money"]
-
-                        # Exclude current monster's own pos from occupied list
-                        other_occupied = [pos for pos in occupied_positions if pos != m["pos"]]
-                        monster.move(other_occupied, state["town_pos"])
-
-                        updated_monsters.append({
-                            "name": monster.name,
-                            "health": monster.health,
-                            "power": monster.power,
-                            "money": monster.money,
-                            "pos": monster.pos,
-                            "color": monster.color,
-                            "description": m.get("description", "")
-                        })
-
-                    state["monsters"] = updated_monsters
-                    with open(MAP_STATE_FILE, 'w') as f:
-                        json.dump(state, f)
+                    return leave_map("exit")
+                move_player(event.key, player_pos)
 
                 # Check if player stepped on a monster
-                for m in state.get("monsters", []):
-                    if player_pos == m["pos"]:
-                        save_map_state(player_pos)
-                        pygame.quit()
-                        return {"type": "monster", "monster": m}
+                m = world["index"].get(player_pos)
+                if m is not None:
+                    return leave_map({"type": "monster", "monster": m})
 
                 if player_pos == town_pos:
-                    save_map_state(player_pos)
-                    pygame.quit()
-                    return {"type": "town"}
+                    return leave_map({"type": "town"})
 
-        # Drawing
-        screen.fill((0, 0, 0))  # Clear screen
-
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                rect = pygame.Rect(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                pygame.draw.rect(screen, (200, 200, 200), rect, 1)  # draw grid border
-
-        # Draw monsters
-        monsters = state.get("monsters", [])
-        for m in monsters:
-            monster_name = m["name"].capitalize()
-            monster_pos = (m["pos"][0] * TILE_SIZE, m["pos"][1] * TILE_SIZE)
-
-            if monster_name in monster_images and monster_images[monster_name]:
-                screen.blit(monster_images[monster_name], monster_pos)
-            else:
-                monster_rect = pygame.Rect(
-                    monster_pos[0], monster_pos[1], TILE_SIZE, TILE_SIZE)
-                pygame.draw.rect(screen, (255, 0, 0), monster_rect)
-
-        # Draw town
-        pygame.draw.circle(
-            screen, (0, 255, 0),
-            (town_pos[0] * TILE_SIZE + TILE_SIZE // 2, town_pos[1] * TILE_SIZE + TILE_SIZE // 2),
-            TILE_SIZE // 3
-        )
+        # World updates run on their own fixed timestep
+        scheduler.advance(elapsed)
 
-        # Draw player
-        if player_image:
-            screen.blit(player_image, (player_pos[0] * TILE_SIZE, player_pos[1] * TILE_SIZE))
-        else:
-            player_rect = pygame.Rect(
-                player_pos[0] * TILE_SIZE, player_pos[1] * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            pygame.draw.rect(screen, (0, 0, 255), player_rect)
+        # Drawing
+        camera.follow(player_pos)
+        draw_map(screen, state, player_pos, town_pos, player_image, monster_images,
+                 previous_positions=world["previous_positions"], alpha=monster_move_alpha(scheduler),
+                 camera=camera, monster_index=world["index"])
 
         pygame.display.flip()
-        clock.tick(30)
+        elapsed = clock.tick(30) / 1000
 
     pygame.quit()
     return {"type": "exit"}
@@ -876,15 +1348,17 @@ def launch_map_adventure(player_hp, player_gold, inventory, equipped_weapon, doc
     """
 
     state = get_persistent_map_state()
-    if not state.get("monsters"):
+    if not state.get("monsters") and not state.get("respawns"):
         init_wandering_monsters()
+    else:
+        spawn_due_monsters()
 
     while True:
         state = get_persistent_map_state()
 
         def move_off_tile(tile):
             if state["player_pos"] == tile:
-                if tile[1] < 9:
+                if tile[1] < GRID_SIZE - 1:
                     state["player_pos"][1] += 1
                 else:
                     state["player_pos"][1] -= 1
@@ -896,8 +1370,10 @@ def launch_map_adventure(player_hp, player_gold, inventory, equipped_weapon, doc
 
         if isinstance(result, dict) and result.get("type") == "monster":
             monster_data = result["monster"]
+            encounter = dict(monster_data)  # checked against the world when the fight is recorded
             player_hp, player_gold, equipped_weapon, doctor_visits = handle_adventure_with_monster(
-                player_hp, player_gold, inventory, equipped_weapon, doctor_visits, monster_data
+                player_hp, player_gold, inventory, equipped_weapon, doctor_visits, monster_data,
+                record_fight=lambda monster: record_monster_fight(monster, encounter)
             )
             print("Returning to the map...")
             return "continue", player_hp, player_gold, equipped_weapon, doctor_visits
@@ -923,43 +1399,73 @@ def explore_until_town(player_hp, player_gold, inventory, equipped_weapon, docto
             break
     return player_hp, player_gold, equipped_weapon, doctor_visits
 
-def init_wandering_monsters():
+_population = None
+
+def world_population(state, index):
+    """
+    Returns the population manager for the world log's cached state, creating it only
+    when that state is first loaded or replaced, so fights and respawn checks don't
+    rebuild it.
+
+    Args:
+        state (dict): The state yielded by worldlog.transaction().
+        index (MonsterIndex): The index yielded alongside it.
+
+    Returns:
+        PopulationManager: The manager bound to that state.
     """
-    Initializes or reloads two monsters on the map and persists them.
+    global _population
+    if _population is None:
+        _population = population.PopulationManager(state, index, grid_size=GRID_SIZE)
+    elif _population.state is not state or _population.index is not index:
+        _population.bind(state, index)
+    return _population
+
+def spawn_due_monsters():
     """
-    state = get_persistent_map_state()
-    town_pos = state["town_pos"]
+    Respawns monsters whose respawn timers have run out and persists them. The world
+    stays locked from reading the respawn queue to writing the new monsters, so two
+    processes can't both run the same respawn.
 
-    monsters = []
-    occupied = [town_pos]
+    Returns:
+        None
+    """
+    with worldlog.transaction() as (state, index):
+        world_population(state, index).run_due(time.time(), worldlog.append_event)
 
-    for _ in range(2):
-        while True:
-            new_pos = [random.randint(0, 9), random.randint(0, 9)]
-            if new_pos not in occupied:
-                break
-        occupied.append(new_pos)
-        base_monster = new_random_monster()
-        wm = WanderingMonster(pos=new_pos)
-        wm.name = base_monster["name"]
-        wm.health = base_monster["health"]
-        wm.power = base_monster["power"]
-        wm.money = base_monster["money"]
-
-        monsters.append({
-            "name": wm.name,
-            "health": wm.health,
-            "power": wm.power,
-            "money": wm.money,
-            "pos": wm.pos,
-            "color": wm.color,
-            "description": base_monster["description"]
-        })
-
-    state["monsters"] = monsters
-    
-    with open(MAP_STATE_FILE, 'w') as f:
-        json.dump(state, f)
+def init_wandering_monsters():
+    """
+    Fills every map region up to its target number of monsters and persists them.
+    """
+    with worldlog.transaction() as (state, index):
+        monsters = state.get("monsters", []) + world_population(state, index).fill_to_target()
+
+        worldlog.append_event("monsters_spawned", monsters=monsters)
+
+# Recipe book: ingredient combinations mapped to potions
+POTION_RECIPES = {
+    frozenset(["vial of blood", "jar of warts"]): {
+        "id": "healing_potion",
+        "name": "healing potion",
+        "type": "consumable",
+        "effect": "heal"
+    },
+    frozenset(["vial of blood", "bag of pixie dust"]): {
+        "id": "energy_elixir",
+        "name": "energy elixir",
+        "type": "consumable",
+        "effect": "boost"
+    },
+    frozenset(["bag of pixie dust", "jar of warts"]): {
+        "id": "invisibility_brew",
+        "name": "invisibility brew",
+        "type": "consumable",
+        "effect": "dodge"
+    }
+}
+
+for _potion in POTION_RECIPES.values():
+    itemprototypes.register_item_prototype(_potion)
 
 def visit_crafting_station(inventory):
     """
@@ -968,25 +1474,6 @@ def visit_crafting_station(inventory):
     """
     print("\n--- Potion Crafting Station ---")
 
-    # Recipe book: ingredient combinations mapped to potions
-    recipes = {
-        frozenset(["vial of blood", "jar of warts"]): {
-            "name": "healing potion",
-            "type": "consumable",
-            "effect": "heal"
-        },
-        frozenset(["vial of blood", "bag of pixie dust"]): {
-            "name": "energy elixir",
-            "type": "consumable",
-            "effect": "boost"
-        },
-        frozenset(["bag of pixie dust", "jar of warts"]): {
-            "name": "invisibility brew",
-            "type": "consumable",
-            "effect": "dodge"
-        }
-    }
-
     ingredients = [item["name"] for item in inventory if item["type"] == "ingredient"]
     if len(ingredients) < 2:
         print("You don't have enough ingredients to craft any potions.")
@@ -1009,7 +1496,7 @@ def visit_crafting_station(inventory):
         print("Invalid selection.")
         return inventory
 
-    potion = recipes.get(chosen)
+    potion = POTION_RECIPES.get(chosen)
     if not potion:
         print("That combination doesn't make anything useful.")
         return inventory
@@ -1020,7 +1507,7 @@ def visit_crafting_station(inventory):
                 del inventory[i]
                 break
 
-    inventory.append(potion)
+    inventory.append(itemprototypes.make_item(potion["id"]))
     print(f"You crafted a {potion['name']}!")
 
     return inventory
\ No newline at end of file
@@ -0,0 +1,188 @@
+#headlessmap.py
+#Haley Burley
+#10/19/2026
+
+"""
+headlessmap.py
+
+Runs the adventure map renderer without a window so it can be benchmarked and
+regression-tested on machines with no display or GPU. Frames are drawn onto an
+offscreen surface with the SDL "dummy" video driver, the player is moved by a
+scripted list of key presses, and every frame can be dumped for pixel comparison.
+
+Functions:
+- run_headless_map(key_script, state, frames_per_key, dump_dir, seed)
+    Replays scripted key presses against the map and returns timing statistics.
+
+- frame_bytes(surface)
+    Returns the raw RGB pixels of a surface for exact comparisons.
+
+- compare_frames(first_path, second_path)
+    Counts the pixels that differ between two dumped frames.
+"""
+
+import os
+import copy
+import time
+
+# The dummy drivers must be selected before pygame initializes its display.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import rngbuffer
+import gamefunctions
+from worldscheduler import WorldScheduler
+from monsterindex import MonsterIndex
+
+FRAME_SECONDS = 1 / 30
+DEFAULT_SEED = 0
+
+KEY_NAMES = {
+    "up": pygame.K_UP,
+    "down": pygame.K_DOWN,
+    "left": pygame.K_LEFT,
+    "right": pygame.K_RIGHT,
+}
+
+DEFAULT_STATE = {
+    "player_pos": [5, 6],
+    "town_pos": [5, 5],
+    "monsters": [
+        {"name": "Pixie", "health": 17, "power": 9, "money": 4.33, "pos": [8, 3]},
+        {"name": "Vampire", "health": 47, "power": 13, "money": 17.66, "pos": [3, 6]},
+    ],
+}
+
+def frame_bytes(surface):
+    """
+    Returns the raw RGB pixel data of a surface.
+
+    Args:
+        surface (pygame.Surface): The frame to read.
+
+    Returns:
+        bytes: The pixels, row by row, three bytes per pixel.
+    """
+    return pygame.image.tostring(surface, "RGB")
+
+def compare_frames(first_path, second_path):
+    """
+    Compares two dumped frames pixel by pixel.
+
+    Args:
+        first_path (str): Path to the first image.
+        second_path (str): Path to the second image.
+
+    Returns:
+        int: Number of pixels that differ, or -1 if the images have different sizes.
+    """
+    first = pygame.image.load(first_path)
+    second = pygame.image.load(second_path)
+    if first.get_size() != second.get_size():
+        return -1
+
+    first_pixels = frame_bytes(first)
+    second_pixels = frame_bytes(second)
+    differing = 0
+    for i in range(0, len(first_pixels), 3):
+        if first_pixels[i:i + 3] != second_pixels[i:i + 3]:
+            differing += 1
+    return differing
+
+def run_headless_map(key_script, state=None, frames_per_key=1, dump_dir=None, seed=DEFAULT_SEED):
+    """
+    Replays a list of key presses against the map renderer on an offscreen surface.
+
+    The world advances by FRAME_SECONDS of simulated time per frame, so monsters move on
+    the same fixed timestep as in launch_map. The shared random buffer is reseeded first,
+    so two runs with the same arguments draw the same frames. Nothing is written to the
+    map state files and encounters do not end the run.
+
+    Args:
+        key_script (list): Key names ("up", "down", "left", "right") or pygame key codes.
+        state (dict, optional): Map state to render. Defaults to a copy of DEFAULT_STATE.
+        frames_per_key (int, optional): Frames to draw after each key press. Defaults to 1.
+        dump_dir (str, optional): Folder to save every frame to as frame_00000.png, etc.
+        seed (int, optional): Seed for monster movement. Defaults to DEFAULT_SEED; None
+            seeds from the OS.
+
+    Returns:
+        dict: Frame and world tick counts, frames per second, and mean/max/total draw time in milliseconds.
+    """
+    pygame.init()
+    rngbuffer.seed(seed)
+    state = copy.deepcopy(state or DEFAULT_STATE)
+    player_pos = list(state["player_pos"])
+    town_pos = state["town_pos"]
+
+    width = gamefunctions.TILE_SIZE * gamefunctions.GRID_SIZE
+    height = gamefunctions.TILE_SIZE * gamefunctions.GRID_SIZE
+    screen = pygame.Surface((width, height))
+
+    player_image, monster_images = gamefunctions.load_map_images()
+
+    if dump_dir:
+        os.makedirs(dump_dir, exist_ok=True)
+
+    previous_positions = [list(m["pos"]) for m in state["monsters"]]
+    monster_index = MonsterIndex(state["monsters"])
+
+    def move_monsters():
+        gamefunctions.remember_positions(previous_positions, state["monsters"])
+        gamefunctions.move_map_monsters(state, player_pos, monster_index)
+
+    scheduler = WorldScheduler()
+    scheduler.add_task("move_monsters", move_monsters, every=gamefunctions.MONSTER_MOVE_TICKS)
+
+    draw_times = []
+    ticks = 0
+    start = time.perf_counter()
+
+    for key in key_script:
+        key_code = KEY_NAMES.get(key, key)
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key_code))
+
+        for event in pygame.event.get():
+            if event.type == pygame.KEYDOWN:
+                gamefunctions.move_player(event.key, player_pos)
+
+        for _ in range(frames_per_key):
+            ticks += scheduler.advance(FRAME_SECONDS)
+            draw_start = time.perf_counter()
+            gamefunctions.draw_map(screen, state, player_pos, town_pos,
+                                   player_image, monster_images,
+                                   previous_positions=previous_positions,
+                                   alpha=gamefunctions.monster_move_alpha(scheduler),
+                                   monster_index=monster_index)
+            draw_times.append(time.perf_counter() - draw_start)
+
+            if dump_dir:
+                frame_path = os.path.join(dump_dir, f"frame_{len(draw_times) - 1:05d}.png")
+                pygame.image.save(screen, frame_path)
+
+    elapsed = time.perf_counter() - start
+    pygame.quit()
+
+    frames = len(draw_times)
+    return {
+        "frames": frames,
+        "ticks": ticks,
+        "fps": frames / elapsed if elapsed > 0 else 0.0,
+        "mean_draw_ms": (sum(draw_times) / frames * 1000) if frames else 0.0,
+        "max_draw_ms": max(draw_times) * 1000 if frames else 0.0,
+        "total_draw_ms": sum(draw_times) * 1000,
+    }
+
+def main():
+    """
+    Runs a short benchmark walk around the map and prints the results.
+    """
+    key_script = ["up", "right", "down", "left"] * 250
+    stats = run_headless_map(key_script)
+    print(f"Frames: {stats['frames']}")
+    print(f"FPS: {stats['fps']:.1f}")
+    print(f"Mean draw: {stats['mean_draw_ms']:.3f} ms, Max draw: {stats['max_draw_ms']:.3f} ms")
+
+if __name__ == "__main__":
+    main()
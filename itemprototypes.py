@@ -0,0 +1,162 @@
+#itemprototypes.py
+#Haley Burley
+#10/19/2026
+
+"""
+itemprototypes.py
+
+Keeps one shared prototype per kind of item (name, type, price, maxDurability, effect...)
+so inventory entries only hold a prototype id plus their own changing fields, such as
+currentDurability. Items still read like the old item dictionaries, e.g. item["name"]
+or item["currentDurability"] -= 1, and save files store just {"id", "currentDurability"}.
+
+Classes:
+- Item(prototype, currentDurability)
+    One item in an inventory; reads missing fields from its prototype.
+
+Functions:
+- item_id_for(name)
+    Turns an item name into the id style used by the prototypes.
+
+- register_item_prototype(prototype)
+    Adds or replaces a prototype, keyed by its "id".
+
+- get_item_prototype(item_id)
+    Looks up a prototype by id.
+
+- make_item(item_id)
+    Creates a new item from a prototype, at full durability.
+
+- item_to_save(item)
+    Returns the compact form of an item for a save file.
+
+- item_from_save(data)
+    Rebuilds an item from a save file, including old saves that stored full dictionaries.
+"""
+
+INSTANCE_FIELDS = ("currentDurability",)
+
+_prototypes = {}
+_prototype_names = {}
+
+class Item:
+    __slots__ = ("prototype", "currentDurability")
+
+    def __init__(self, prototype, currentDurability=None):
+        self.prototype = prototype
+        self.currentDurability = currentDurability
+
+    def __getitem__(self, key):
+        if key == "currentDurability":
+            if self.currentDurability is None:
+                raise KeyError(key)
+            return self.currentDurability
+        return self.prototype[key]
+
+    def __setitem__(self, key, value):
+        if key not in INSTANCE_FIELDS:
+            raise KeyError(f"{key} is shared by every {self.prototype['name']} and can't be changed per item.")
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        if key == "currentDurability":
+            return self.currentDurability is not None
+        return key in self.prototype
+
+    def get(self, key, default=None):
+        """
+        Returns a field like dict.get.
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __repr__(self):
+        return f"Item({self.prototype['id']!r}, currentDurability={self.currentDurability!r})"
+
+def item_id_for(name):
+    """
+    Returns the id for an item name, e.g. "vial of blood" -> "vial_of_blood".
+    """
+    return name.replace(" ", "_")
+
+def register_item_prototype(prototype):
+    """
+    Adds or replaces an item prototype. Per-item fields such as currentDurability are
+    left out of the stored prototype.
+
+    Args:
+        prototype (dict): Item fields including a unique "id".
+
+    Returns:
+        dict: The stored prototype.
+    """
+    stored = {key: value for key, value in prototype.items() if key not in INSTANCE_FIELDS}
+    _prototypes[stored["id"]] = stored
+    _prototype_names[(stored["name"], stored["type"])] = stored
+    return stored
+
+def get_item_prototype(item_id):
+    """
+    Looks up a prototype by id.
+
+    Args:
+        item_id (str): The prototype id, e.g. "sword".
+
+    Returns:
+        dict or None: The prototype, or None if no prototype has that id.
+    """
+    return _prototypes.get(item_id)
+
+def make_item(item_id):
+    """
+    Creates a new item from a prototype. Items with a maxDurability start at full durability.
+
+    Args:
+        item_id (str): The prototype id.
+
+    Returns:
+        Item: The new item.
+
+    Raises:
+        KeyError: If no prototype has that id.
+    """
+    prototype = _prototypes[item_id]
+    return Item(prototype, prototype.get("maxDurability"))
+
+def item_to_save(item):
+    """
+    Returns the compact form of an item for a save file.
+
+    Args:
+        item (Item): The item.
+
+    Returns:
+        dict: {"id": ...} plus "currentDurability" if the item has one.
+    """
+    data = {"id": item.prototype["id"]}
+    if item.currentDurability is not None:
+        data["currentDurability"] = item.currentDurability
+    return data
+
+def item_from_save(data):
+    """
+    Rebuilds an item from its saved form. Older saves stored every field of an item, so
+    those are matched to a prototype by id, or else by name and type; an unknown item
+    gets a prototype made from its own fields.
+
+    Args:
+        data (dict): A saved item, compact or full.
+
+    Returns:
+        Item: The rebuilt item.
+    """
+    prototype = _prototypes.get(data.get("id"))
+    if prototype is None:
+        prototype = _prototype_names.get((data.get("name"), data.get("type")))
+    if prototype is None:
+        fields = dict(data)
+        fields.setdefault("id", item_id_for(fields["name"]))
+        prototype = register_item_prototype(fields)
+    return Item(prototype, data.get("currentDurability"))
@@ -0,0 +1,77 @@
+#mapcamera.py
+#Haley Burley
+#10/19/2026
+
+"""
+mapcamera.py
+
+A camera for the adventure map that follows the player around a world that can be
+larger than the window. It knows which tiles are on screen, so the renderer only
+draws what can be seen and the cost of a frame depends on the window size rather
+than the size of the world.
+
+Classes:
+- Camera(view_width, view_height, world_width, world_height, tile_size)
+    Tracks the top-left visible tile and converts world tiles to screen pixels.
+"""
+
+class Camera:
+    def __init__(self, view_width, view_height, world_width, world_height, tile_size):
+        self.view_width = min(view_width, world_width)
+        self.view_height = min(view_height, world_height)
+        self.world_width = world_width
+        self.world_height = world_height
+        self.tile_size = tile_size
+        self.x = 0
+        self.y = 0
+
+    @property
+    def pixel_size(self):
+        """
+        The (width, height) of the view in pixels, for sizing the window.
+        """
+        return (self.view_width * self.tile_size, self.view_height * self.tile_size)
+
+    def follow(self, pos):
+        """
+        Centers the view on a tile, stopping at the edges of the world.
+
+        Args:
+            pos (list): The [x, y] tile to follow, usually the player.
+
+        Returns:
+            None
+        """
+        self.x = max(0, min(pos[0] - self.view_width // 2, self.world_width - self.view_width))
+        self.y = max(0, min(pos[1] - self.view_height // 2, self.world_height - self.view_height))
+
+    def visible_bounds(self, margin=0):
+        """
+        Returns the range of tiles on screen.
+
+        Args:
+            margin (int, optional): Extra tiles to include around the view, e.g. for
+                monsters sliding in from just off screen. Defaults to 0.
+
+        Returns:
+            tuple: (left, top, right, bottom) tile coordinates; right and bottom are exclusive.
+        """
+        return (max(0, self.x - margin), max(0, self.y - margin),
+                min(self.world_width, self.x + self.view_width + margin),
+                min(self.world_height, self.y + self.view_height + margin))
+
+    def is_visible(self, pos):
+        """
+        Returns True if a tile is inside the view.
+        """
+        return (self.x <= pos[0] < self.x + self.view_width
+                and self.y <= pos[1] < self.y + self.view_height)
+
+    def to_screen(self, x, y):
+        """
+        Converts a (possibly fractional) world tile position to screen pixels.
+
+        Returns:
+            tuple: (x, y) pixel position of the tile's top-left corner.
+        """
+        return (round((x - self.x) * self.tile_size), round((y - self.y) * self.tile_size))
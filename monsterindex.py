@@ -0,0 +1,124 @@
+#monsterindex.py
+#Haley Burley
+#10/19/2026
+
+"""
+monsterindex.py
+
+Keeps a position -> monster hash index next to a map state's monster list, so finding
+the monster on a tile and removing a defeated monster are constant-time lookups instead
+of scans over the whole list.
+
+Classes:
+- MonsterIndex(monsters)
+    Wraps a monster list and keeps a tile -> list slot index in sync with it.
+"""
+
+class MonsterIndex:
+    def __init__(self, monsters):
+        self.reset(monsters)
+
+    def reset(self, monsters):
+        """
+        Points the index at a monster list and re-indexes every monster.
+
+        Args:
+            monsters (list): The monster dictionaries; the index edits this list in place.
+
+        Returns:
+            None
+        """
+        self.monsters = monsters
+        self.slots = {tuple(m["pos"]): i for i, m in enumerate(monsters)}
+
+    def __contains__(self, pos):
+        return tuple(pos) in self.slots
+
+    def __len__(self):
+        return len(self.monsters)
+
+    def get(self, pos):
+        """
+        Returns the monster standing on a tile.
+
+        Args:
+            pos (list or tuple): The [x, y] tile.
+
+        Returns:
+            dict or None: The monster, or None if the tile is empty.
+        """
+        slot = self.slots.get(tuple(pos))
+        return self.monsters[slot] if slot is not None else None
+
+    def query_rect(self, left, top, right, bottom):
+        """
+        Finds the monsters inside a rectangle of tiles. Looks up each tile when the
+        rectangle is smaller than the population, otherwise checks each monster.
+
+        Args:
+            left (int): First column.
+            top (int): First row.
+            right (int): Column after the last one.
+            bottom (int): Row after the last one.
+
+        Returns:
+            list: (slot, monster) pairs, where slot is the monster's place in the list.
+        """
+        found = []
+        if (right - left) * (bottom - top) < len(self.monsters):
+            for x in range(left, right):
+                for y in range(top, bottom):
+                    slot = self.slots.get((x, y))
+                    if slot is not None:
+                        found.append((slot, self.monsters[slot]))
+        else:
+            for slot, monster in enumerate(self.monsters):
+                x, y = monster["pos"]
+                if left <= x < right and top <= y < bottom:
+                    found.append((slot, monster))
+        return found
+
+    def add(self, monster):
+        """
+        Appends a monster to the list and indexes its tile.
+        """
+        self.slots[tuple(monster["pos"])] = len(self.monsters)
+        self.monsters.append(monster)
+
+    def move(self, monster, new_pos):
+        """
+        Moves a monster to a new tile and updates the index. The monster's existing
+        position list is updated in place rather than replaced.
+
+        Args:
+            monster (dict): A monster that is in the list.
+            new_pos (list or tuple): Its new [x, y] tile.
+
+        Returns:
+            None
+        """
+        pos = monster["pos"]
+        slot = self.slots.pop((pos[0], pos[1]))
+        pos[0], pos[1] = new_pos
+        self.slots[(pos[0], pos[1])] = slot
+
+    def remove(self, pos):
+        """
+        Removes the monster on a tile by swapping the last monster into its slot.
+        This changes the order of the list.
+
+        Args:
+            pos (list or tuple): The [x, y] tile.
+
+        Returns:
+            dict or None: The removed monster, or None if the tile was empty.
+        """
+        slot = self.slots.pop(tuple(pos), None)
+        if slot is None:
+            return None
+        removed = self.monsters[slot]
+        last = self.monsters.pop()
+        if last is not removed:
+            self.monsters[slot] = last
+            self.slots[tuple(last["pos"])] = slot
+        return removed
@@ -0,0 +1,202 @@
+#monstertemplates.py
+#Haley Burley
+#10/19/2026
+
+"""
+monstertemplates.py
+
+Keeps a table of monster templates (name, description, stat ranges and spawn weight)
+that is loaded once from monsters.json, and spawns monsters from it in constant time
+with an alias-method sampler. Only the chosen template's stats are rolled.
+
+Functions:
+- load_monster_templates(filename)
+    Loads the template table from a JSON file and rebuilds the sampler.
+
+- register_monster_template(template)
+    Adds or replaces a single template and rebuilds the sampler.
+
+- build_alias_table(weights)
+    Builds the probability and alias lists used for O(1) weighted sampling.
+
+- get_monster_template(name)
+    Looks up a single template by monster name.
+
+- roll_monster()
+    Picks a template by spawn weight and returns a new monster dict with rolled stats.
+
+- roll_monsters(count)
+    Rolls many monsters at once, drawing all of their random numbers in bulk.
+"""
+
+import json
+from rngbuffer import rng
+
+MONSTER_TEMPLATE_FILE = "monsters.json"
+
+_templates = []
+_template_index = {}
+_alias_prob = []
+_alias_index = []
+
+def build_alias_table(weights):
+    """
+    Builds an alias table (Vose's method) for sampling indexes in proportion to weights.
+
+    Args:
+        weights (list): Non-negative spawn weights, one per template.
+
+    Returns:
+        tuple: (list) probability of keeping each slot, (list) alias index for each slot.
+    """
+    count = len(weights)
+    total = float(sum(weights))
+    if count == 0 or total <= 0:
+        raise ValueError("Monster spawn weights must contain a positive value.")
+
+    scaled = [w * count / total for w in weights]
+    prob = [0.0] * count
+    alias = [0] * count
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] = scaled[l] + scaled[s] - 1.0
+        if scaled[l] < 1.0:
+            small.append(l)
+        else:
+            large.append(l)
+
+    # Leftovers are only off from 1.0 by rounding error
+    for i in large + small:
+        prob[i] = 1.0
+        alias[i] = i
+
+    return prob, alias
+
+def _rebuild_sampler():
+    """
+    Rebuilds the alias table and name index after the template list changes.
+    """
+    global _alias_prob, _alias_index, _template_index
+    _alias_prob, _alias_index = build_alias_table([t.get("weight", 1) for t in _templates])
+    _template_index = {t["name"]: i for i, t in enumerate(_templates)}
+
+def load_monster_templates(filename=MONSTER_TEMPLATE_FILE):
+    """
+    Loads the monster template table from a JSON file, replacing any loaded templates.
+
+    Args:
+        filename (str, optional): JSON file holding a list of templates. Defaults to monsters.json.
+
+    Returns:
+        list: The loaded template dictionaries.
+    """
+    global _templates
+    with open(filename, 'r') as f:
+        _templates = json.load(f)
+    _rebuild_sampler()
+    return _templates
+
+def register_monster_template(template):
+    """
+    Adds a monster template, replacing an existing template with the same name.
+
+    Args:
+        template (dict): Template with "name", "description", "health", "power" and
+            "money" ranges as [low, high], and an optional "weight" (defaults to 1).
+
+    Returns:
+        None
+    """
+    if not _templates:
+        load_monster_templates()
+    if template["name"] in _template_index:
+        _templates[_template_index[template["name"]]] = template
+    else:
+        _templates.append(template)
+    _rebuild_sampler()
+
+def get_monster_template(name):
+    """
+    Looks up a template by monster name.
+
+    Args:
+        name (str): The monster's name, e.g. "Frog".
+
+    Returns:
+        dict or None: The template, or None if no monster has that name.
+    """
+    if not _templates:
+        load_monster_templates()
+    index = _template_index.get(name)
+    return _templates[index] if index is not None else None
+
+def roll_monster():
+    """
+    Picks a monster template by spawn weight and rolls its health, power and money.
+
+    Returns:
+        dict: A dictionary containing the monster's name, description, health, power, and money reward.
+    """
+    if not _templates:
+        load_monster_templates()
+
+    slot = rng.randrange(len(_templates))
+    if rng.random() >= _alias_prob[slot]:
+        slot = _alias_index[slot]
+    template = _templates[slot]
+
+    health = template["health"]
+    power = template["power"]
+    money = template["money"]
+    return {
+        "name": template["name"],
+        "description": template["description"],
+        "health": rng.randint(health[0], health[1]),
+        "power": rng.randint(power[0], power[1]),
+        "money": round(rng.uniform(money[0], money[1]), 2),
+    }
+
+def roll_monsters(count):
+    """
+    Rolls count monsters like roll_monster, but draws every random number in a few bulk
+    calls instead of five calls per monster.
+
+    Args:
+        count (int): How many monsters to roll.
+
+    Returns:
+        list: One monster dict per roll, in the same format as roll_monster.
+    """
+    if not _templates:
+        load_monster_templates()
+
+    slots = rng.randranges(len(_templates), count)
+    coins = rng.randoms(count)
+    health_rolls = rng.randoms(count)
+    power_rolls = rng.randoms(count)
+    money_rolls = rng.randoms(count)
+
+    monsters = []
+    for slot, coin, health_roll, power_roll, money_roll in zip(
+            slots, coins, health_rolls, power_rolls, money_rolls):
+        if coin >= _alias_prob[slot]:
+            slot = _alias_index[slot]
+        template = _templates[slot]
+
+        health = template["health"]
+        power = template["power"]
+        money = template["money"]
+        monsters.append({
+            "name": template["name"],
+            "description": template["description"],
+            "health": health[0] + int(health_roll * (health[1] - health[0] + 1)),
+            "power": power[0] + int(power_roll * (power[1] - power[0] + 1)),
+            "money": round(money[0] + (money[1] - money[0]) * money_roll, 2),
+        })
+    return monsters
@@ -0,0 +1,218 @@
+#population.py
+#Haley Burley
+#10/19/2026
+
+"""
+population.py
+
+Manages the wandering monster population on the map. The map is split into square
+regions that each aim to hold TARGET_PER_REGION monsters. A manager is created once per
+world and kept for as long as the world is loaded: it reads monster positions from the
+world's MonsterIndex and uses the world's "respawns" list directly as its heap, so both
+stay current as events are applied and nothing is rebuilt per event.
+
+Scheduling a respawn is one heap push and running a due respawn is one heap pop. Free
+tiles are kept in a free-list per region that is only built the first time that region
+spawns a monster, so picking a spawn tile is a swap-and-pop over at most one region
+instead of work proportional to the whole map.
+
+Changes to the world are never made here directly; they are handed to a record(event_type,
+**fields) callable, such as worldlog.append_event, which logs and applies them.
+
+Classes:
+- PopulationManager(state, index, grid_size, region_size, target_per_region, respawn_delay)
+    Tracks free tiles and pending respawns for one world and creates new monsters.
+"""
+
+import heapq
+import monstertemplates
+from rngbuffer import rng
+from monsterindex import MonsterIndex
+
+# One region of two monsters on the 10x10 map, as many as the game always started with;
+# bigger maps get two per 10x10 region
+REGION_SIZE = 10
+TARGET_PER_REGION = 2
+RESPAWN_DELAY = 60.0  # seconds
+
+class PopulationManager:
+    def __init__(self, state, index=None, grid_size=10, region_size=REGION_SIZE,
+                 target_per_region=TARGET_PER_REGION, respawn_delay=RESPAWN_DELAY):
+        self.grid_size = grid_size
+        self.region_size = region_size
+        self.target_per_region = target_per_region
+        self.respawn_delay = respawn_delay
+
+        self.free_tiles = {}   # region -> free-list of candidate (x, y) tiles, built on first use
+        self.reserved = set()  # tiles handed out by spawn() that may not be indexed yet
+        self.bind(state, index)
+
+    def bind(self, state, index=None):
+        """
+        Points the manager at a world. The respawn list is heapified once here and from
+        then on is only changed by heap pushes and pops.
+
+        Args:
+            state (dict): The map state with "town_pos", "player_pos", "monsters" and
+                optionally "respawns" as [[due_time, [region_x, region_y]], ...].
+            index (MonsterIndex, optional): The index kept in sync with state["monsters"]
+                as events are applied. One is built if not given.
+
+        Returns:
+            None
+        """
+        self.state = state
+        self.index = index if index is not None else MonsterIndex(state["monsters"])
+        heapq.heapify(state.setdefault("respawns", []))
+        self.free_tiles.clear()
+        self.reserved.clear()
+
+    def region_of(self, pos):
+        """
+        Returns the (column, row) of the region that contains a tile.
+        """
+        return (pos[0] // self.region_size, pos[1] // self.region_size)
+
+    def regions(self):
+        """
+        Returns every region of the map.
+        """
+        count = -(-self.grid_size // self.region_size)
+        return [(column, row) for column in range(count) for row in range(count)]
+
+    def _region_bounds(self, region):
+        left = region[0] * self.region_size
+        top = region[1] * self.region_size
+        return (left, top, min(left + self.region_size, self.grid_size),
+                min(top + self.region_size, self.grid_size))
+
+    def region_count(self, region):
+        """
+        Returns how many monsters are in a region, from the monster index.
+        """
+        return len(self.index.query_rect(*self._region_bounds(region)))
+
+    def is_free(self, pos, avoid=()):
+        """
+        Returns True if nothing stands on a tile: no monster, the town, the player, a
+        monster that was just spawned, or any tile in avoid.
+        """
+        pos = tuple(pos)
+        return (pos not in self.index and pos not in self.reserved and pos not in avoid
+                and pos != tuple(self.state["town_pos"]) and pos != tuple(self.state["player_pos"]))
+
+    def release(self, pos):
+        """
+        Puts a tile back on its region's free-list, if that list has been built.
+        """
+        tiles = self.free_tiles.get(self.region_of(pos))
+        if tiles is not None:
+            tiles.append(tuple(pos))
+
+    def _pick_tile(self, region, avoid=()):
+        """
+        Swap-and-pops random tiles off a region's free-list until one is still free.
+        Tiles that filled up since they were listed are dropped along the way; the list
+        is rebuilt from the region's tiles once if it runs out.
+        """
+        tiles = self.free_tiles.get(region)
+        for attempt in range(2):
+            if not tiles:
+                left, top, right, bottom = self._region_bounds(region)
+                tiles = [(x, y) for x in range(left, right) for y in range(top, bottom)
+                         if self.is_free((x, y), avoid)]
+                self.free_tiles[region] = tiles
+            while tiles:
+                i = rng.randrange(len(tiles))
+                tiles[i], tiles[-1] = tiles[-1], tiles[i]
+                pos = tiles.pop()
+                if self.is_free(pos, avoid):
+                    return pos
+        return None
+
+    def spawn(self, region, avoid=()):
+        """
+        Creates a monster on a random free tile of a region. Static per-type data such
+        as the description stays in the monster's template instead of being copied.
+        The monster is not added to the world; record a monster_spawned event for that.
+
+        Args:
+            region (tuple): The (column, row) of the region.
+            avoid (set, optional): Extra (x, y) tiles to keep clear, e.g. other players.
+
+        Returns:
+            dict or None: The new monster, or None if the region has no free tiles.
+        """
+        pos = self._pick_tile(region, avoid)
+        if pos is None:
+            return None
+        self.reserved.add(pos)
+
+        base_monster = monstertemplates.roll_monster()
+        return {
+            "name": base_monster["name"],
+            "health": base_monster["health"],
+            "power": base_monster["power"],
+            "money": base_monster["money"],
+            "pos": list(pos)
+        }
+
+    def fill_to_target(self):
+        """
+        Spawns monsters until every region holds its target number. This visits every
+        region, so it is meant for setting up a new world.
+
+        Returns:
+            list: The monsters that were created.
+        """
+        self.reserved.clear()
+        spawned = []
+        for region in self.regions():
+            for _ in range(self.target_per_region - self.region_count(region)):
+                monster = self.spawn(region)
+                if monster is None:
+                    break
+                spawned.append(monster)
+        return spawned
+
+    def schedule_respawn(self, pos, now, record):
+        """
+        Queues a respawn for the region where a monster died.
+
+        Args:
+            pos (list): Where the monster died.
+            now (float): The current time in seconds.
+            record (callable): record(event_type, **fields) logs and applies an event.
+
+        Returns:
+            None
+        """
+        self.release(pos)
+        region = self.region_of(pos)
+        record("respawn_scheduled", due=now + self.respawn_delay, region=list(region))
+
+    def run_due(self, now, record, avoid=()):
+        """
+        Pops every respawn whose time has come and spawns into regions below target.
+
+        Args:
+            now (float): The current time in seconds.
+            record (callable): record(event_type, **fields) logs and applies an event;
+                respawn_popped pops the heap and monster_spawned adds the monster.
+            avoid (set, optional): Extra (x, y) tiles to keep clear, e.g. other players.
+
+        Returns:
+            list: The monsters that were created.
+        """
+        self.reserved.clear()
+        spawned = []
+        respawns = self.state["respawns"]
+        while respawns and respawns[0][0] <= now:
+            region = tuple(respawns[0][1])
+            record("respawn_popped")
+            if self.region_count(region) < self.target_per_region:
+                monster = self.spawn(region, avoid)
+                if monster is not None:
+                    record("monster_spawned", monster=monster)
+                    spawned.append(monster)
+        return spawned
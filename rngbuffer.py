@@ -0,0 +1,153 @@
+#rngbuffer.py
+#Haley Burley
+#10/19/2026
+
+"""
+rngbuffer.py
+
+Provides a random number source that draws values in large blocks, so tight loops
+(combat damage, monster movement, spawning) don't pay Python's per-call RNG overhead.
+Single values are handed out from a buffered block of uniform floats; loops that need
+many values at once should use the bulk methods (randoms, randints, uniforms,
+randranges), which draw a whole list in one NumPy call. NumPy's Generator is used when
+it is installed; otherwise values come from the random module.
+
+Classes:
+- RandomBuffer(seed, block_size)
+    Buffered source with randint, uniform, random, choice and shuffle methods and
+    bulk randoms, randints, uniforms and randranges methods.
+
+Functions:
+- seed(value)
+    Reseeds the shared buffer so simulations can be reproduced.
+"""
+
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_BLOCK_SIZE = 4096
+
+class RandomBuffer:
+    def __init__(self, seed=None, block_size=DEFAULT_BLOCK_SIZE):
+        self.block_size = block_size
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        """
+        Resets the generator and throws away any values already drawn.
+
+        Args:
+            seed (int, optional): Seed for reproducible sequences. None seeds from the OS.
+
+        Returns:
+            None
+        """
+        if np is not None:
+            self._generator = np.random.default_rng(seed)
+        else:
+            self._generator = random.Random(seed)
+        self._next = iter(()).__next__
+
+    def _refill(self):
+        """
+        Draws the next block of uniform floats in [0, 1).
+        """
+        if np is not None:
+            values = self._generator.random(self.block_size).tolist()
+        else:
+            rand = self._generator.random
+            values = [rand() for _ in range(self.block_size)]
+        self._next = iter(values).__next__
+
+    def random(self):
+        """
+        Returns the next uniform float in [0, 1).
+        """
+        try:
+            return self._next()
+        except StopIteration:
+            self._refill()
+            return self._next()
+
+    def randint(self, low, high):
+        """
+        Returns a random integer N such that low <= N <= high, like random.randint.
+        """
+        return low + int(self.random() * (high - low + 1))
+
+    def uniform(self, low, high):
+        """
+        Returns a random float between low and high, like random.uniform.
+        """
+        return low + (high - low) * self.random()
+
+    def randrange(self, stop):
+        """
+        Returns a random integer in range(stop).
+        """
+        return int(self.random() * stop)
+
+    def choice(self, seq):
+        """
+        Returns a random element from a non-empty sequence.
+        """
+        return seq[int(self.random() * len(seq))]
+
+    def shuffle(self, items):
+        """
+        Shuffles a list in place with the Fisher-Yates algorithm.
+        """
+        for i in range(len(items) - 1, 0, -1):
+            j = int(self.random() * (i + 1))
+            items[i], items[j] = items[j], items[i]
+
+    def randoms(self, count):
+        """
+        Returns a list of count uniform floats in [0, 1), drawn in one call.
+        """
+        if np is not None:
+            return self._generator.random(count).tolist()
+        rand = self._generator.random
+        return [rand() for _ in range(count)]
+
+    def randints(self, low, high, count):
+        """
+        Returns a list of count random integers N such that low <= N <= high.
+        """
+        if np is not None:
+            return self._generator.integers(low, high + 1, count).tolist()
+        span = high - low + 1
+        return [low + int(value * span) for value in self.randoms(count)]
+
+    def uniforms(self, low, high, count):
+        """
+        Returns a list of count random floats between low and high.
+        """
+        if np is not None:
+            return self._generator.uniform(low, high, count).tolist()
+        span = high - low
+        return [low + span * value for value in self.randoms(count)]
+
+    def randranges(self, stop, count):
+        """
+        Returns a list of count random integers in range(stop).
+        """
+        return self.randints(0, stop - 1, count)
+
+rng = RandomBuffer()
+
+def seed(value=None):
+    """
+    Reseeds the shared buffer used by the game's combat, movement and spawning code.
+
+    Args:
+        value (int, optional): Seed for a reproducible run. None seeds from the OS.
+
+    Returns:
+        None
+    """
+    rng.seed(value)
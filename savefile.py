@@ -0,0 +1,154 @@
+#savefile.py
+#Haley Burley
+#10/19/2026
+
+"""
+savefile.py
+
+Reads and writes save files split into sections (player stats, inventory, equipment),
+each stored as its own JSON blob. A small header at the front records where
+every section starts and which section holds each field, so opening a save only reads
+the header, and a section is read and decoded the first time one of its fields is asked
+for. Resuming to the town menu then costs the same however big the inventory is.
+
+Save file layout:
+- 4 bytes:  the magic string b"SAV1"
+- 4 bytes:  length of the JSON header, big-endian
+- header:   JSON with "sections" (name -> [offset, length] after the header) and
+            "fields" (field name -> section name)
+- sections: one JSON document per section, back to back
+
+Saves from before this layout are a single JSON object and are still read, in full.
+The game keeps its save at savefile.json for those older saves, but new saves are in this
+binary layout, not JSON.
+
+An open SaveFile keeps its file open until close(), so sections decoded later still come
+from the same save even if another session has since replaced the file.
+
+Classes:
+- SaveFile(filename)
+    An open save; get() decodes only the section that holds the requested field, and
+    close() releases the file.
+
+Functions:
+- write_save(filename, sections)
+    Writes a sectioned save file atomically.
+"""
+
+import os
+import json
+import struct
+
+SAVE_MAGIC = b"SAV1"
+
+def write_save(filename, sections):
+    """
+    Writes a sectioned save file. The file is written to a temporary name first and
+    then swapped in, so a crash never leaves a half-written save.
+
+    Args:
+        filename (str): Where to save.
+        sections (dict): Section name -> dict of the fields stored in that section.
+
+    Returns:
+        None
+    """
+    blobs = []
+    index = {}
+    fields = {}
+    offset = 0
+    for name, values in sections.items():
+        blob = json.dumps(values, separators=(",", ":")).encode("utf-8")
+        index[name] = [offset, len(blob)]
+        offset += len(blob)
+        blobs.append(blob)
+        for field in values:
+            fields[field] = name
+
+    header = json.dumps({"sections": index, "fields": fields}).encode("utf-8")
+    temp_file = filename + ".tmp"
+    with open(temp_file, "wb") as f:
+        f.write(SAVE_MAGIC)
+        f.write(struct.pack(">I", len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(temp_file, filename)
+
+class SaveFile:
+    def __init__(self, filename):
+        self.filename = filename
+        self.decoded = {}  # section name -> decoded dict
+
+        # The file stays open so later section reads see this save even if the file
+        # is replaced on disk; os.replace leaves an open file pointing at the old data.
+        self.file = f = open(filename, "rb")
+        magic = f.read(4)
+        if magic != SAVE_MAGIC:
+            # An older save: one JSON object holding every field
+            f.seek(0)
+            values = json.loads(f.read())
+            self.close()
+            self.sections = {"legacy": None}
+            self.fields = {field: "legacy" for field in values}
+            self.decoded["legacy"] = values
+            self.data_start = 0
+            return
+        try:
+            (header_length,) = struct.unpack(">I", f.read(4))
+            header = json.loads(f.read(header_length))
+        except (struct.error, ValueError):
+            self.close()
+            raise
+
+        self.sections = header["sections"]
+        self.fields = header["fields"]
+        self.data_start = 8 + header_length
+
+    def __contains__(self, field):
+        return field in self.fields
+
+    def close(self):
+        """
+        Closes the save's file. Sections already decoded can still be read.
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def section(self, name):
+        """
+        Returns one section, reading and decoding it on first use.
+
+        Args:
+            name (str): The section name, e.g. "player" or "inventory".
+
+        Returns:
+            dict: The fields stored in that section.
+
+        Raises:
+            ValueError: If the section wasn't decoded before the save was closed.
+        """
+        if name not in self.decoded:
+            if self.file is None:
+                raise ValueError(f"Save {self.filename} is closed; section {name} was never read.")
+            offset, length = self.sections[name]
+            self.file.seek(self.data_start + offset)
+            self.decoded[name] = json.loads(self.file.read(length))
+        return self.decoded[name]
+
+    def get(self, field, default=None):
+        """
+        Returns a saved field like dict.get, decoding only the section that holds it.
+
+        Args:
+            field (str): The field name, e.g. "player_hp".
+            default (optional): Returned if the save has no such field. Defaults to None.
+
+        Returns:
+            The field's value, or default.
+        """
+        name = self.fields.get(field)
+        if name is None:
+            return default
+        return self.section(name).get(field, default)
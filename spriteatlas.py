@@ -0,0 +1,144 @@
+#spriteatlas.py
+#Haley Burley
+#10/19/2026
+
+"""
+spriteatlas.py
+
+Packs every sprite in the images folder into one atlas file, already scaled to each
+supported tile size, so the map can start up with a single file open and no image
+decoding or rescaling. Run this file after adding or changing a sprite:
+
+    python spriteatlas.py
+
+Atlas file layout (images/sprites.atlas):
+- 4 bytes:  the magic string b"ATL1"
+- 4 bytes:  length of the JSON header, big-endian
+- header:   JSON with the atlas "width" and "height" and a "sprites" table of
+            tile size -> sprite name -> [x, y, width, height]
+- pixels:   raw RGBA pixel data for the whole atlas, row by row
+
+Functions:
+- build_atlas(image_dir, tile_sizes, atlas_file)
+    Scales and packs the sprites and writes the atlas file.
+
+- load_atlas(atlas_file, use_mmap)
+    Reads the atlas into one surface plus its sprite table.
+
+- atlas_sprites(atlas, sprite_table, tile_size)
+    Returns sub-surfaces of the atlas for one tile size, keyed by sprite name.
+"""
+
+import os
+import glob
+import json
+import mmap
+import struct
+
+import pygame
+
+ATLAS_FILE = os.path.join("images", "sprites.atlas")
+ATLAS_MAGIC = b"ATL1"
+TILE_SIZES = (16, 32, 64)
+
+def build_atlas(image_dir="images", tile_sizes=TILE_SIZES, atlas_file=ATLAS_FILE):
+    """
+    Scales every PNG in a folder to each tile size and packs them into one atlas file.
+    Each tile size gets its own row of sprites.
+
+    Args:
+        image_dir (str, optional): Folder of source sprites. Defaults to "images".
+        tile_sizes (tuple, optional): Tile sizes to pre-scale to. Defaults to TILE_SIZES.
+        atlas_file (str, optional): Where to write the atlas. Defaults to ATLAS_FILE.
+
+    Returns:
+        dict: The sprite table written to the header.
+    """
+    paths = sorted(glob.glob(os.path.join(image_dir, "*.png")))
+    images = {os.path.splitext(os.path.basename(path))[0]: pygame.image.load(path) for path in paths}
+
+    width = max(1, max(size * len(images) for size in tile_sizes))
+    height = max(1, sum(tile_sizes))
+    atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+
+    sprites = {}
+    y = 0
+    for size in tile_sizes:
+        row = {}
+        for i, (name, image) in enumerate(images.items()):
+            x = i * size
+            atlas.blit(pygame.transform.scale(image, (size, size)), (x, y))
+            row[name] = [x, y, size, size]
+        sprites[str(size)] = row
+        y += size
+
+    header = json.dumps({"width": width, "height": height, "sprites": sprites}).encode("utf-8")
+    with open(atlas_file, "wb") as f:
+        f.write(ATLAS_MAGIC)
+        f.write(struct.pack(">I", len(header)))
+        f.write(header)
+        f.write(pygame.image.tostring(atlas, "RGBA"))
+
+    return sprites
+
+def load_atlas(atlas_file=ATLAS_FILE, use_mmap=False):
+    """
+    Loads the atlas file into one surface with a single read, or through mmap.
+
+    Args:
+        atlas_file (str, optional): The atlas to read. Defaults to ATLAS_FILE.
+        use_mmap (bool, optional): Map the file instead of reading it. Defaults to False.
+
+    Returns:
+        tuple: (pygame.Surface) the whole atlas, (dict) tile size -> sprite name -> rect.
+
+    Raises:
+        ValueError: If the file is not an atlas.
+    """
+    with open(atlas_file, "rb") as f:
+        if use_mmap:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = f.read()
+
+    try:
+        if data[:4] != ATLAS_MAGIC:
+            raise ValueError(f"{atlas_file} is not a sprite atlas.")
+        (header_length,) = struct.unpack(">I", data[4:8])
+        header = json.loads(bytes(data[8:8 + header_length]))
+        pixels = data[8 + header_length:]
+        # fromstring copies the pixels, so the mapping can be closed afterwards
+        atlas = pygame.image.fromstring(bytes(pixels), (header["width"], header["height"]), "RGBA")
+    finally:
+        if use_mmap:
+            data.close()
+
+    return atlas, header["sprites"]
+
+def atlas_sprites(atlas, sprite_table, tile_size):
+    """
+    Returns the sprites for one tile size as sub-surfaces that share the atlas's pixels.
+
+    Args:
+        atlas (pygame.Surface): The loaded atlas.
+        sprite_table (dict): Tile size -> sprite name -> rect, from load_atlas.
+        tile_size (int): The tile size wanted.
+
+    Returns:
+        dict or None: Sprite name -> sub-surface, or None if the atlas lacks that size.
+    """
+    rects = sprite_table.get(str(tile_size))
+    if rects is None:
+        return None
+    return {name: atlas.subsurface(pygame.Rect(rect)) for name, rect in rects.items()}
+
+def main():
+    """
+    Rebuilds the atlas from the images folder.
+    """
+    pygame.init()
+    sprites = build_atlas()
+    print(f"Packed {len(sprites[str(TILE_SIZES[0])])} sprites at sizes {TILE_SIZES} into {ATLAS_FILE}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#textscreen.py
+#Haley Burley
+#10/19/2026
+
+"""
+textscreen.py
+
+Builds a whole text menu in memory and writes it to the terminal in a single write
+and flush, instead of one print() per line. Over a remote terminal every small write
+can turn into its own round trip, so batching a screen makes each turn feel faster.
+
+With diff=True, a screen that is redrawn in place (nothing else printed in between)
+only rewrites the lines that changed since the last frame, using ANSI cursor codes.
+
+Classes:
+- TextScreen(stream, diff)
+    Collects lines for one frame and writes them out in one go.
+"""
+
+import sys
+
+CURSOR_UP = "\x1b[{}A"
+CLEAR_LINE = "\r\x1b[2K"
+CLEAR_BELOW = "\x1b[J"
+
+class TextScreen:
+    def __init__(self, stream=None, diff=False):
+        self.stream = stream
+        self.diff = diff
+        self.lines = []
+        self.previous = None
+
+    def add(self, text=""):
+        """
+        Adds text to the frame; text containing newlines becomes several lines.
+
+        Args:
+            text (str, optional): The text to add. Defaults to a blank line.
+
+        Returns:
+            TextScreen: This screen, so calls can be chained.
+        """
+        self.lines.extend(str(text).split("\n"))
+        return self
+
+    def invalidate(self):
+        """
+        Forgets the last frame so the next flush redraws everything, e.g. after other
+        output has been printed below it.
+        """
+        self.previous = None
+
+    def render(self):
+        """
+        Returns the text that flush() would write, without writing it.
+
+        Returns:
+            str: The full frame, or only the changed lines when diffing.
+        """
+        if not self.diff or self.previous is None:
+            return "\n".join(self.lines) + "\n"
+
+        # Jump back to the top of the last frame and rewrite changed lines only
+        parts = [CURSOR_UP.format(len(self.previous))] if self.previous else []
+        for i, line in enumerate(self.lines):
+            if i < len(self.previous) and self.previous[i] == line:
+                parts.append("\n")
+            else:
+                parts.append(CLEAR_LINE + line + "\n")
+        if len(self.lines) < len(self.previous):
+            parts.append(CLEAR_BELOW)
+        return "".join(parts)
+
+    def flush(self):
+        """
+        Writes the frame in a single write call, flushes the stream and starts a new frame.
+
+        Returns:
+            None
+        """
+        stream = self.stream or sys.stdout
+        stream.write(self.render())
+        stream.flush()
+        self.previous = self.lines if self.diff else None
+        self.lines = []
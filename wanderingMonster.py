@@ -2,7 +2,12 @@
 #Haley Burley
 #4/20/2025
 
-import random
+import itertools
+from rngbuffer import rng
+
+# Every order the four step directions can be tried in, built once so a move
+# only has to pick one instead of allocating and shuffling a new list
+DIRECTION_ORDERS = tuple(itertools.permutations(((0, 1), (0, -1), (1, 0), (-1, 0))))
 
 class WanderingMonster:
     COLORS = {
@@ -11,22 +16,39 @@ class WanderingMonster:
         "Frog": (0, 128, 0),          # Dark Green
     }
 
-    def __init__(self, pos=None):
-        monster = random.choice(list(self.COLORS.keys()))
+    def __init__(self, pos=None, name=None, health=None, power=None, money=None):
+        # Only roll the stats that weren't passed in
+        monster = name if name is not None else rng.choice(list(self.COLORS.keys()))
         self.name = monster
-        self.health = random.randint(15, 40)
-        self.power = random.randint(5, 12)
-        self.money = round(random.uniform(5, 20), 2)
-        self.pos = pos or [random.randint(0, 9), random.randint(0, 9)]
+        self.health = health if health is not None else rng.randint(15, 40)
+        self.power = power if power is not None else rng.randint(5, 12)
+        self.money = money if money is not None else round(rng.uniform(5, 20), 2)
+        self.pos = pos or [rng.randint(0, 9), rng.randint(0, 9)]
         self.color = list(self.COLORS.get(monster, (255, 255, 255)))
 
-    def move(self, occupied, town_pos):
-        directions = [[0, 1], [0, -1], [1, 0], [-1, 0]]
-        random.shuffle(directions)
-        for dx, dy in directions:
-            new_x = self.pos[0] + dx
-            new_y = self.pos[1] + dy
-            if 0 <= new_x <= 9 and 0 <= new_y <= 9:
-                if [new_x, new_y] not in occupied and [new_x, new_y] != town_pos:
-                    self.pos = [new_x, new_y]
-                    break
+    @staticmethod
+    def next_position(pos, occupied, blocked, grid_size=10, order=None):
+        """
+        Picks a random free neighboring tile for a monster at pos.
+
+        occupied is any container of (x, y) tuples supporting "in" (a set, or a dict
+        keyed by position); blocked is a small tuple of extra (x, y) tiles to avoid.
+        order is an index into DIRECTION_ORDERS, so a caller moving many monsters can
+        draw them all at once with rng.randranges; one is drawn here if not given.
+        Returns the new (x, y) tuple, or None if every neighbor is taken.
+        """
+        if order is None:
+            order = rng.randrange(len(DIRECTION_ORDERS))
+        for dx, dy in DIRECTION_ORDERS[order]:
+            new_x = pos[0] + dx
+            new_y = pos[1] + dy
+            if 0 <= new_x < grid_size and 0 <= new_y < grid_size:
+                if (new_x, new_y) not in occupied and (new_x, new_y) not in blocked:
+                    return (new_x, new_y)
+        return None
+
+    def move(self, occupied, town_pos, grid_size=10):
+        # occupied is a set of (x, y) tuples so each check is a hash lookup
+        new_pos = self.next_position(self.pos, occupied, (tuple(town_pos),), grid_size)
+        if new_pos is not None:
+            self.pos = list(new_pos)
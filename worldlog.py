@@ -0,0 +1,381 @@
+#worldlog.py
+#Haley Burley
+#10/19/2026
+
+"""
+worldlog.py
+
+Records changes to the map world (player moves, monster spawns, moves, damage and
+deaths) as an append-only log of JSON lines instead of rewriting the whole map state
+on every change. Every COMPACT_EVERY events the current state is written out as a
+snapshot (map_state.json), the log is moved onto the end of an archive file, and the
+log starts over, so loading only has to replay a short tail. The archive keeps the
+full history for auditing and rewinding a session.
+
+Several processes (a game session, batch tools, the world server) can share one world.
+Writers take an advisory lock on map_state.lock, catch up on events other processes
+wrote, and only then append, so no update is lost. append_event can also be given the
+sequence number the caller's changes were based on and refuses to write if the world
+has moved on since (compare-and-swap). Readers never take the lock: the snapshot is
+swapped in atomically, and a read that overlaps a compaction is simply retried.
+
+Event types:
+- player_moved:      {"pos": [x, y]}
+- monsters_spawned:  {"monsters": [monster, ...]}   replaces the whole population
+- monsters_moved:    {"positions": [[x, y], ...]}   one position per monster, in order
+- monster_damaged:   {"pos": [x, y], "health": hp}
+- monster_removed:   {"pos": [x, y]}
+- monster_spawned:   {"monster": monster}           adds one monster
+- respawn_scheduled: {"due": time, "region": [rx, ry]}   pushes onto the respawn heap
+- respawn_popped:    {}                              pops the earliest respawn
+- respawns_updated:  {"respawns": [[due, [rx, ry]], ...]}   replaces the queue (older logs)
+
+Classes:
+- WorldConflictError
+    Raised when a compare-and-swap append finds the world has changed.
+
+Functions:
+- apply_event(state, event, index)
+    Applies one event to a map state dictionary.
+
+- load_world_state()
+    Reads a consistent copy of the current state without taking the lock.
+
+- world_lock()
+    Holds the cross-process write lock, with this process's cached state up to date.
+
+- transaction()
+    Holds the write lock and yields the up-to-date state and index for a read-modify-write.
+
+- append_event(event_type, expected_seq, **fields)
+    Appends an event to the log under the lock, compacting when the tail gets long.
+
+- compact()
+    Writes a fresh snapshot and archives the log.
+
+- rebuild_state(upto_seq)
+    Replays the archive and log from the beginning, optionally stopping at an event.
+"""
+
+import os
+import json
+import copy
+import heapq
+from contextlib import contextmanager
+from monsterindex import MonsterIndex
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # no advisory locks on this platform; only one writer is safe
+
+SNAPSHOT_FILE = "map_state.json"
+LOG_FILE = "map_events.jsonl"
+ARCHIVE_FILE = "map_events_archive.jsonl"
+LOCK_FILE = "map_state.lock"
+COMPACT_EVERY = 200
+READ_RETRIES = 10
+
+DEFAULT_STATE = {
+    "player_pos": [5, 5],
+    "town_pos": [5, 5],
+    "monsters": [],
+    "seq": 0
+}
+
+# This process's copy of the world for writing, so appends don't have to re-read the log.
+# _log_offset and _snapshot_id record how far it has read, to catch up on other writers.
+_last_seq = None
+_tail_length = 0
+_state = None
+_index = None
+_log_offset = 0
+_snapshot_id = None
+
+_lock_file = None
+_lock_depth = 0
+
+class WorldConflictError(Exception):
+    """
+    The world changed after the state a compare-and-swap append was based on.
+    """
+
+def apply_event(state, event, index=None):
+    """
+    Applies a single logged event to a map state dictionary in place.
+
+    Args:
+        state (dict): The map state to update.
+        event (dict): The event, with "seq", "type" and the type's fields.
+        index (MonsterIndex, optional): Position index over state["monsters"], kept in
+            sync so monster lookups are O(1). One is built if not given.
+
+    Returns:
+        dict: The updated state.
+    """
+    if index is None:
+        index = MonsterIndex(state["monsters"])
+
+    event_type = event["type"]
+    if event_type == "player_moved":
+        state["player_pos"] = list(event["pos"])
+    elif event_type == "monsters_spawned":
+        state["monsters"] = copy.deepcopy(event["monsters"])
+        index.reset(state["monsters"])
+    elif event_type == "monsters_moved":
+        for monster, pos in zip(state["monsters"], event["positions"]):
+            monster["pos"] = list(pos)
+        index.reset(state["monsters"])
+    elif event_type == "monster_damaged":
+        monster = index.get(event["pos"])
+        if monster is not None:
+            monster["health"] = event["health"]
+    elif event_type == "monster_removed":
+        index.remove(event["pos"])
+    elif event_type == "monster_spawned":
+        index.add(copy.deepcopy(event["monster"]))
+    elif event_type == "respawn_scheduled":
+        heapq.heappush(state.setdefault("respawns", []), [event["due"], list(event["region"])])
+    elif event_type == "respawn_popped":
+        heapq.heappop(state["respawns"])
+    elif event_type == "respawns_updated":
+        state["respawns"] = copy.deepcopy(event["respawns"])
+        heapq.heapify(state["respawns"])
+    state["seq"] = event["seq"]
+    return state
+
+def _read_events(filename, offset=0):
+    """
+    Reads the complete events from a JSON lines file, starting at a byte offset and
+    stopping before a torn final line.
+
+    Returns:
+        tuple: (list) the events, (int) the byte offset just after the last complete line.
+    """
+    events = []
+    if not os.path.exists(filename):
+        return events, 0
+    with open(filename, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+            offset += len(line)
+    return events, offset
+
+def _snapshot_identity():
+    """
+    Returns something that changes whenever a new snapshot is swapped in.
+    """
+    try:
+        stat = os.stat(SNAPSHOT_FILE)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+def _write_snapshot(state):
+    """
+    Writes the snapshot to a temporary file and swaps it in so readers never see half a file.
+    """
+    temp_file = SNAPSHOT_FILE + ".tmp"
+    with open(temp_file, 'w') as f:
+        json.dump(state, f)
+    os.replace(temp_file, SNAPSHOT_FILE)
+
+def _read_world():
+    """
+    Reads the snapshot plus the log events that follow it, retrying if a compaction
+    swaps in a new snapshot part way through.
+
+    Returns:
+        tuple: (dict) the state, (int) events replayed, (int) log offset read up to,
+            (tuple) identity of the snapshot that was read.
+    """
+    for _ in range(READ_RETRIES):
+        snapshot_id = _snapshot_identity()
+        if snapshot_id is None:
+            state = copy.deepcopy(DEFAULT_STATE)
+        else:
+            try:
+                with open(SNAPSHOT_FILE, 'r') as f:
+                    state = json.load(f)
+            except FileNotFoundError:
+                continue
+            state.setdefault("seq", 0)
+
+        events, offset = _read_events(LOG_FILE)
+        if _snapshot_identity() != snapshot_id:
+            continue
+
+        index = MonsterIndex(state["monsters"])
+        replayed = 0
+        for event in events:
+            if event["seq"] <= state["seq"]:
+                continue
+            if event["seq"] != state["seq"] + 1:
+                break  # the log was rewritten while we read it
+            apply_event(state, event, index)
+            replayed += 1
+        return state, replayed, offset, snapshot_id
+    raise RuntimeError("The world state kept changing while it was being read.")
+
+def load_world_state():
+    """
+    Loads the latest snapshot and replays any logged events written after it. This never
+    waits for the write lock, and always returns the world as it was at one point in time.
+
+    Returns:
+        dict: The current map state with player position, town position and monsters.
+    """
+    if _snapshot_identity() is None:
+        with world_lock():
+            if _snapshot_identity() is None:
+                _write_snapshot(DEFAULT_STATE)
+    state, _, _, _ = _read_world()
+    return state
+
+def _catch_up():
+    """
+    Brings this process's cached state up to date with events other processes appended.
+    Must be called with the lock held.
+    """
+    global _last_seq, _tail_length, _state, _index, _log_offset, _snapshot_id
+    if _state is None or _snapshot_identity() != _snapshot_id:
+        # First write, or another process compacted: start again from the snapshot
+        _state, _tail_length, _log_offset, _snapshot_id = _read_world()
+        _index = MonsterIndex(_state["monsters"])
+    else:
+        events, _log_offset = _read_events(LOG_FILE, _log_offset)
+        for event in events:
+            if event["seq"] > _state["seq"]:
+                apply_event(_state, event, _index)
+                _tail_length += 1
+    _last_seq = _state["seq"]
+
+    # Drop a line torn by a writer that crashed, so the next event starts on a fresh line
+    if os.path.exists(LOG_FILE) and os.path.getsize(LOG_FILE) > _log_offset:
+        with open(LOG_FILE, 'rb') as f:
+            f.seek(_log_offset)
+            torn = b"\n" not in f.read()
+        if torn:
+            os.truncate(LOG_FILE, _log_offset)
+
+@contextmanager
+def world_lock():
+    """
+    Takes the cross-process write lock on the world and catches up on events written by
+    other processes. Nested uses in one process share the same lock.
+
+    Yields:
+        None
+    """
+    global _lock_file, _lock_depth
+    if _lock_depth == 0:
+        _lock_file = open(LOCK_FILE, 'a')
+        if fcntl is not None:
+            fcntl.flock(_lock_file.fileno(), fcntl.LOCK_EX)
+    _lock_depth += 1
+    try:
+        if _lock_depth == 1:
+            _catch_up()
+        yield
+    finally:
+        _lock_depth -= 1
+        if _lock_depth == 0:
+            if fcntl is not None:
+                fcntl.flock(_lock_file.fileno(), fcntl.LOCK_UN)
+            _lock_file.close()
+            _lock_file = None
+
+@contextmanager
+def transaction():
+    """
+    Holds the write lock for a read-modify-write, so no other process can change the
+    world between reading it and appending events based on it.
+
+    Yields:
+        tuple: (dict) the current state and (MonsterIndex) its position index. Treat them
+            as read-only and change them with append_event, which updates both in place.
+    """
+    with world_lock():
+        yield _state, _index
+
+def append_event(event_type, expected_seq=None, **fields):
+    """
+    Appends an event to the world log and applies it to the cached state.
+
+    Args:
+        event_type (str): One of the event types listed in the module docstring.
+        expected_seq (int, optional): The "seq" of the state this change was based on.
+            If the world has moved past it, nothing is written. Defaults to None (always write).
+        **fields: The event's data, e.g. pos=[3, 4].
+
+    Returns:
+        dict: The event that was written, including its sequence number.
+
+    Raises:
+        WorldConflictError: If expected_seq is given and is no longer the latest seq.
+    """
+    global _last_seq, _tail_length, _log_offset
+    with world_lock():
+        if expected_seq is not None and expected_seq != _last_seq:
+            raise WorldConflictError(
+                f"{event_type} was based on event {expected_seq}, but the world is at {_last_seq}.")
+
+        event = {"seq": _last_seq + 1, "type": event_type}
+        event.update(fields)
+        with open(LOG_FILE, 'ab') as f:
+            f.write((json.dumps(event) + "\n").encode("utf-8"))
+            _log_offset = f.tell()
+
+        apply_event(_state, event, _index)
+        _last_seq = event["seq"]
+        _tail_length += 1
+        if _tail_length >= COMPACT_EVERY:
+            compact()
+    return event
+
+def compact():
+    """
+    Writes the current state as the new snapshot, then moves the log onto the archive.
+
+    Returns:
+        None
+    """
+    global _tail_length, _log_offset, _snapshot_id
+    with world_lock():
+        _write_snapshot(_state)
+        _snapshot_id = _snapshot_identity()
+
+        if os.path.exists(LOG_FILE):
+            with open(LOG_FILE, 'r') as log, open(ARCHIVE_FILE, 'a') as archive:
+                archive.write(log.read())
+            open(LOG_FILE, 'w').close()
+        _tail_length = 0
+        _log_offset = 0
+
+def rebuild_state(upto_seq=None):
+    """
+    Replays the full history from the default state, for audits and rewinding.
+    Changes made before the world log existed are not part of the history.
+
+    Args:
+        upto_seq (int, optional): Stop after the event with this sequence number.
+            None replays everything.
+
+    Returns:
+        dict: The map state as it was after the last replayed event.
+    """
+    state = copy.deepcopy(DEFAULT_STATE)
+    index = MonsterIndex(state["monsters"])
+    for event in _read_events(ARCHIVE_FILE)[0] + _read_events(LOG_FILE)[0]:
+        if upto_seq is not None and event["seq"] > upto_seq:
+            break
+        if event["seq"] <= state["seq"]:
+            continue  # already archived by an interrupted compaction
+        apply_event(state, event, index)
+    return state
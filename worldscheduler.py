@@ -0,0 +1,106 @@
+#worldscheduler.py
+#Haley Burley
+#10/19/2026
+
+"""
+worldscheduler.py
+
+Runs world updates (like monster movement) on a fixed timestep instead of on key
+presses, so the game world keeps the same pace no matter how fast the player types or
+how fast frames are drawn. Each tick has a time budget: tasks with priority 0 always
+run, while lower-priority tasks (higher numbers) are put off to a later tick once the
+budget is used up. The alpha property tells the renderer how far it is between two
+ticks so it can draw moving things in between.
+
+Classes:
+- WorldScheduler(tick_seconds, budget_seconds, max_ticks_per_frame)
+    Holds the scheduled tasks and advances the world by whole ticks.
+"""
+
+import time
+
+TICK_SECONDS = 0.1
+TICK_BUDGET_SECONDS = 0.005
+MAX_TICKS_PER_FRAME = 5
+
+class WorldScheduler:
+    def __init__(self, tick_seconds=TICK_SECONDS, budget_seconds=TICK_BUDGET_SECONDS,
+                 max_ticks_per_frame=MAX_TICKS_PER_FRAME):
+        self.tick_seconds = tick_seconds
+        self.budget_seconds = budget_seconds
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.tasks = []
+        self.deferred = []
+        self.tick_count = 0
+        self.accumulator = 0.0
+        self.last_tick_cost = 0.0
+
+    def add_task(self, name, update, priority=0, every=1):
+        """
+        Schedules a function to run every few ticks.
+
+        Args:
+            name (str): A label for the task.
+            update (callable): Called with no arguments when the task runs.
+            priority (int, optional): 0 always runs; higher numbers may be deferred when
+                the tick runs over budget. Defaults to 0.
+            every (int, optional): Run once every this many ticks. Defaults to 1.
+
+        Returns:
+            None
+        """
+        self.tasks.append({"name": name, "update": update, "priority": priority, "every": every})
+        self.tasks.sort(key=lambda task: task["priority"])
+
+    @property
+    def alpha(self):
+        """
+        How far the world is between the last tick and the next one, from 0.0 to 1.0.
+        """
+        return min(self.accumulator / self.tick_seconds, 1.0)
+
+    def tick(self):
+        """
+        Runs one fixed-length tick: every due task in priority order, deferring
+        low-priority tasks once the time budget is spent.
+
+        Returns:
+            None
+        """
+        self.tick_count += 1
+        due = self.deferred + [task for task in self.tasks
+                               if self.tick_count % task["every"] == 0 and task not in self.deferred]
+        due.sort(key=lambda task: task["priority"])
+        self.deferred = []
+
+        start = time.perf_counter()
+        for task in due:
+            over_budget = time.perf_counter() - start > self.budget_seconds
+            if task["priority"] > 0 and over_budget:
+                self.deferred.append(task)
+                continue
+            task["update"]()
+        self.last_tick_cost = time.perf_counter() - start
+
+    def advance(self, elapsed):
+        """
+        Adds real time that has passed and runs as many whole ticks as it covers.
+        If the world falls too far behind, the extra time is dropped rather than
+        running a long burst of catch-up ticks.
+
+        Args:
+            elapsed (float): Seconds since the last call.
+
+        Returns:
+            int: Number of ticks that were run.
+        """
+        self.accumulator += elapsed
+        ticks = 0
+        while self.accumulator >= self.tick_seconds:
+            if ticks == self.max_ticks_per_frame:
+                self.accumulator = self.accumulator % self.tick_seconds
+                break
+            self.tick()
+            self.accumulator -= self.tick_seconds
+            ticks += 1
+        return ticks
@@ -0,0 +1,651 @@
+#worldserver.py
+#Haley Burley
+#10/19/2026
+
+"""
+worldserver.py
+
+A local server that owns the shared map world, so several players can explore the
+same map at once without each game reading and rewriting the map state files. The
+server is the only process that writes the world log. Clients connect over a Unix
+socket or TCP on localhost and speak newline-delimited JSON.
+
+Each tick the server applies every player's queued key presses as one batch, moves
+the monsters on their fixed timestep, and broadcasts one small delta with only what
+changed. The full world is only sent when a player joins or comes back from a fight.
+
+Messages from a client:
+- {"type": "join", "name": str}
+- {"type": "input", "key": "up" | "down" | "left" | "right"}
+- {"type": "fight_result", "pos": [x, y], "health": int}
+- {"type": "leave"}
+
+Messages from the server:
+- {"type": "welcome", "id": int, "state": {...}, "players": {id: [x, y]}}
+- {"type": "delta", "tick": int, "players": {id: [x, y]}, "left": [id, ...],
+   "moves": [[old_x, old_y, new_x, new_y], ...], "removed": [[x, y], ...],
+   "damaged": [[x, y, hp], ...], "spawned": [monster, ...]}
+- {"type": "encounter", "monster": {...}}
+
+Classes:
+- WorldServer(address, tick_seconds)
+    Accepts players, runs the world ticks and broadcasts deltas.
+
+- WorldClient(address, name)
+    Connects to a server and keeps a local copy of the world in sync.
+
+Functions:
+- launch_shared_map(client)
+    A launch_map-style window for one player in the shared world.
+
+- explore_shared_world(address, name, player_hp, player_gold, inventory, equipped_weapon, doctor_visits)
+    Plays the shared map, fighting encounters, until the player leaves.
+"""
+
+import os
+import json
+import time
+import socket
+import argparse
+import selectors
+
+import pygame
+
+import worldlog
+import eventbus
+import population
+import gamefunctions
+from rngbuffer import rng
+from monsterindex import MonsterIndex
+from wanderingMonster import WanderingMonster, DIRECTION_ORDERS
+
+TICK_SECONDS = 0.1
+RESPAWN_CHECK_TICKS = 50
+DEFAULT_SOCKET = "/tmp/adventure_world.sock"
+
+KEY_STEPS = {
+    "up": (0, -1),
+    "down": (0, 1),
+    "left": (-1, 0),
+    "right": (1, 0),
+}
+
+def _open_socket(address):
+    """
+    Returns a stream socket for a Unix socket path (str) or a (host, port) tuple.
+    """
+    if isinstance(address, str):
+        return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    return socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+
+def _encode(message):
+    """
+    Encodes a message as one compact JSON line.
+    """
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+
+def _valid_fight_result(message):
+    """
+    Returns True if a fight_result has an [x, y] tile of ints and an int health.
+    """
+    pos = message.get("pos")
+    health = message.get("health")
+    return (isinstance(pos, list) and len(pos) == 2
+            and all(isinstance(v, int) and not isinstance(v, bool) for v in pos)
+            and isinstance(health, int) and not isinstance(health, bool))
+
+class WorldServer:
+    def __init__(self, address=DEFAULT_SOCKET, tick_seconds=TICK_SECONDS):
+        self.address = address
+        self.tick_seconds = tick_seconds
+        self.selector = selectors.DefaultSelector()
+        self.listener = None
+
+        self.state = worldlog.load_world_state()
+        if not self.state.get("monsters") and not self.state.get("respawns"):
+            gamefunctions.init_wandering_monsters()
+            self.state = worldlog.load_world_state()
+        self.index = MonsterIndex(self.state["monsters"])
+        self.population = population.PopulationManager(self.state, self.index, grid_size=gamefunctions.GRID_SIZE)
+        self.seq = self.state["seq"]
+        self.players = {}      # id -> {"name", "pos", "inputs", "busy"}
+        self.connections = {}  # socket -> {"id", "inbox", "outbox"}
+        self.next_player_id = 1
+        self.tick_count = 0
+        self.monsters_dirty = False
+        self._reset_delta()
+
+    def _reset_delta(self):
+        self.delta = {"players": {}, "left": [], "moves": [], "removed": [], "damaged": [], "spawned": []}
+
+    def start(self):
+        """
+        Opens the listening socket.
+        """
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.remove(self.address)
+        self.listener = _open_socket(self.address)
+        if not isinstance(self.address, str):
+            self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind(self.address)
+        self.listener.listen()
+        self.listener.setblocking(False)
+        self.selector.register(self.listener, selectors.EVENT_READ)
+
+    def serve_forever(self):
+        """
+        Runs ticks at a fixed rate and handles network traffic in between.
+        """
+        self.start()
+        print(f"World server listening on {self.address}")
+        next_tick = time.monotonic()
+        try:
+            while True:
+                self.poll(max(0.0, next_tick - time.monotonic()))
+                if time.monotonic() >= next_tick:
+                    self.tick()
+                    next_tick += self.tick_seconds
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Saves the monsters, disconnects everyone and closes the listening socket.
+        """
+        self._persist_monsters()
+        for sock in list(self.connections):
+            self._drop(sock)
+        if self.listener:
+            self.selector.unregister(self.listener)
+            self.listener.close()
+            self.listener = None
+            if isinstance(self.address, str) and os.path.exists(self.address):
+                os.remove(self.address)
+
+    def poll(self, timeout=0.0):
+        """
+        Accepts connections, reads messages and sends queued output.
+
+        Args:
+            timeout (float, optional): Seconds to wait for traffic. Defaults to 0.
+
+        Returns:
+            None
+        """
+        for key, events in self.selector.select(timeout):
+            sock = key.fileobj
+            if sock is self.listener:
+                self._accept()
+                continue
+            if events & selectors.EVENT_READ:
+                self._read(sock)
+            if sock in self.connections and events & selectors.EVENT_WRITE:
+                self._flush(sock)
+
+    def _accept(self):
+        sock, _ = self.listener.accept()
+        sock.setblocking(False)
+        self.connections[sock] = {"id": None, "inbox": b"", "outbox": b""}
+        self.selector.register(sock, selectors.EVENT_READ)
+
+    def _drop(self, sock):
+        conn = self.connections.pop(sock, None)
+        if conn and conn["id"] in self.players:
+            del self.players[conn["id"]]
+            self.delta["left"].append(conn["id"])
+        self.selector.unregister(sock)
+        sock.close()
+
+    def _read(self, sock):
+        try:
+            data = sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._drop(sock)
+            return
+
+        conn = self.connections[sock]
+        conn["inbox"] += data
+        *lines, conn["inbox"] = conn["inbox"].split(b"\n")
+        for line in lines:
+            if line.strip():
+                try:
+                    self._handle(sock, json.loads(line))
+                except (ValueError, KeyError, TypeError):
+                    pass  # ignore malformed messages
+            if sock not in self.connections:
+                return
+
+    def _send(self, sock, payload):
+        conn = self.connections[sock]
+        if not conn["outbox"]:
+            self.selector.modify(sock, selectors.EVENT_READ | selectors.EVENT_WRITE)
+        conn["outbox"] += payload
+
+    def _flush(self, sock):
+        conn = self.connections[sock]
+        try:
+            sent = sock.send(conn["outbox"])
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._drop(sock)
+            return
+        conn["outbox"] = conn["outbox"][sent:]
+        if not conn["outbox"]:
+            self.selector.modify(sock, selectors.EVENT_READ)
+
+    def _send_welcome(self, sock, player_id):
+        self._send(sock, _encode({
+            "type": "welcome",
+            "id": player_id,
+            "state": self.state,
+            "players": {pid: p["pos"] for pid, p in self.players.items()},
+        }))
+
+    def _handle(self, sock, message):
+        if not isinstance(message, dict):
+            return
+        conn = self.connections[sock]
+        kind = message.get("type")
+
+        if kind == "join" and conn["id"] is None:
+            player_id = self.next_player_id
+            self.next_player_id += 1
+            conn["id"] = player_id
+            self.players[player_id] = {
+                "name": message.get("name", f"Player {player_id}"),
+                "pos": self._free_start_tile(),
+                "inputs": [],
+                "busy": False,
+            }
+            self.delta["players"][player_id] = self.players[player_id]["pos"]
+            self._send_welcome(sock, player_id)
+        elif kind == "input" and conn["id"] in self.players:
+            if isinstance(message.get("key"), str) and message["key"] in KEY_STEPS:
+                self.players[conn["id"]]["inputs"].append(message["key"])
+        elif kind == "fight_result" and conn["id"] in self.players and _valid_fight_result(message):
+            self._apply_fight(message["pos"], message["health"])
+            self.players[conn["id"]]["busy"] = False
+            self._send_welcome(sock, conn["id"])
+        elif kind == "leave":
+            self._drop(sock)
+
+    def _free_start_tile(self):
+        """
+        Returns a free tile next to the town for a new player.
+        """
+        town = self.state["town_pos"]
+        taken = {tuple(p["pos"]) for p in self.players.values()}
+        for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (-1, -1), (1, -1), (-1, 1)):
+            tile = (town[0] + dx, town[1] + dy)
+            if (0 <= tile[0] < gamefunctions.GRID_SIZE and 0 <= tile[1] < gamefunctions.GRID_SIZE
+                    and tile not in self.index and tile not in taken):
+                return list(tile)
+        return [town[0], min(town[1] + 1, gamefunctions.GRID_SIZE - 1)]
+
+    def _apply_fight(self, pos, health):
+        """
+        Applies a fight reported by a client and records it in the world log.
+        """
+        self._persist_monsters()
+        monster = self.index.get(pos)
+        if monster is None:
+            return
+        if health <= 0:
+            self.delta["removed"].append(list(pos))
+            self._append("monster_removed", pos=list(pos))
+            self.population.schedule_respawn(pos, time.time(), self._append)
+        else:
+            self.delta["damaged"].append([pos[0], pos[1], health])
+            self._append("monster_damaged", pos=list(pos), health=health)
+
+    def _append(self, event_type, **fields):
+        """
+        Logs an event that only touches one monster or the respawn queue and applies it
+        to the server's state. If another process wrote to the world in between, self.seq
+        is left behind so the next monster save notices and resyncs.
+        """
+        event = worldlog.append_event(event_type, **fields)
+        worldlog.apply_event(self.state, event, self.index)
+        if event["seq"] == self.seq + 1:
+            self.seq = event["seq"]
+
+    def _persist_monsters(self):
+        """
+        Saves every monster's position, unless another process changed the world since
+        the server last synced, in which case the server reloads it and resends it.
+        """
+        if not self.monsters_dirty:
+            return
+        self.monsters_dirty = False
+        try:
+            event = worldlog.append_event("monsters_moved", expected_seq=self.seq,
+                                          positions=[m["pos"] for m in self.state["monsters"]])
+            self.seq = event["seq"]
+        except worldlog.WorldConflictError:
+            self._resync()
+
+    def _resync(self):
+        """
+        Reloads the world from disk and sends it to every player who isn't in a fight.
+        """
+        self.state = worldlog.load_world_state()
+        self.index.reset(self.state["monsters"])
+        self.population.bind(self.state, self.index)
+        self.seq = self.state["seq"]
+        self._reset_delta()
+        for sock, conn in self.connections.items():
+            player = self.players.get(conn["id"])
+            if player is not None and not player["busy"]:
+                self._send_welcome(sock, conn["id"])
+
+    def tick(self):
+        """
+        Runs one world tick: batched player moves, monster moves, respawns, then one
+        delta broadcast to every player who isn't in a fight.
+
+        Returns:
+            None
+        """
+        self.tick_count += 1
+        grid_size = gamefunctions.GRID_SIZE
+
+        # A monster already in a fight can't be fought by a second player, so its tile is blocked
+        engaged = {tuple(p["pos"]) for p in self.players.values() if p["busy"]}
+
+        for player_id, player in self.players.items():
+            if player["busy"] or not player["inputs"]:
+                player["inputs"].clear()
+                continue
+            pos = player["pos"]
+            for key in player["inputs"]:
+                dx, dy = KEY_STEPS[key]
+                step = (min(max(pos[0] + dx, 0), grid_size - 1),
+                        min(max(pos[1] + dy, 0), grid_size - 1))
+                if step in engaged:
+                    continue
+                pos[0], pos[1] = step
+                if self.index.get(pos) is not None:
+                    break
+            player["inputs"].clear()
+            self.delta["players"][player_id] = pos
+
+            monster = self.index.get(pos)
+            if monster is not None:
+                player["busy"] = True
+                engaged.add(tuple(pos))
+                for sock, conn in self.connections.items():
+                    if conn["id"] == player_id:
+                        self._send(sock, _encode({"type": "encounter", "monster": monster}))
+
+        if self.tick_count % gamefunctions.MONSTER_MOVE_TICKS == 0:
+            blocked = {tuple(p["pos"]) for p in self.players.values()}
+            blocked.add(tuple(self.state["town_pos"]))
+            monsters = self.state["monsters"]
+            orders = rng.randranges(len(DIRECTION_ORDERS), len(monsters))
+            for m, order in zip(monsters, orders):
+                if tuple(m["pos"]) in blocked:
+                    continue  # in a fight with a player
+                old_x, old_y = m["pos"]
+                new_pos = WanderingMonster.next_position(m["pos"], self.index.slots, blocked,
+                                                         grid_size, order)
+                if new_pos is not None:
+                    self.index.move(m, new_pos)
+                    self.delta["moves"].append([old_x, old_y, new_pos[0], new_pos[1]])
+                    self.monsters_dirty = True
+
+        if self.tick_count % gamefunctions.PERSIST_TICKS == 0:
+            self._persist_monsters()
+
+        if self.tick_count % RESPAWN_CHECK_TICKS == 0 and self.state.get("respawns"):
+            self._spawn_due()
+
+        self._broadcast()
+
+    def _spawn_due(self):
+        self._persist_monsters()
+        players = {tuple(p["pos"]) for p in self.players.values()}
+        spawned = self.population.run_due(time.time(), self._append, avoid=players)
+        self.delta["spawned"].extend(spawned)
+
+    def _broadcast(self):
+        if any(self.delta.values()):
+            message = {"type": "delta", "tick": self.tick_count}
+            message.update({key: value for key, value in self.delta.items() if value})
+            payload = _encode(message)
+            for sock, conn in list(self.connections.items()):
+                player = self.players.get(conn["id"])
+                if player is not None and not player["busy"]:
+                    self._send(sock, payload)
+        self._reset_delta()
+
+class WorldClient:
+    def __init__(self, address=DEFAULT_SOCKET, name="Player"):
+        self.sock = _open_socket(address)
+        self.sock.connect(address)
+        self.sock.setblocking(False)
+        self.inbox = b""
+        self.player_id = None
+        self.state = None
+        self.index = None
+        self.players = {}
+        self.encounter = None
+        self.send({"type": "join", "name": name})
+        self._wait_for_state()
+
+    def _wait_for_state(self):
+        """
+        Waits for the server's welcome message.
+
+        Raises:
+            ConnectionError: If the server closes the connection first.
+        """
+        while self.state is None:
+            if not self.poll(timeout=1.0):
+                raise ConnectionError("The world server closed the connection.")
+
+    @property
+    def player_pos(self):
+        """
+        This player's [x, y] position as last reported by the server.
+        """
+        return self.players[self.player_id]
+
+    def send(self, message):
+        """
+        Sends one message to the server.
+        """
+        self.sock.setblocking(True)
+        try:
+            self.sock.sendall(_encode(message))
+        finally:
+            self.sock.setblocking(False)
+
+    def poll(self, timeout=0.0):
+        """
+        Reads and applies every message the server has sent.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the first message. Defaults to 0.
+
+        Returns:
+            bool: False if the server closed the connection.
+        """
+        if timeout > 0:
+            self.sock.settimeout(timeout)
+        try:
+            data = self.sock.recv(65536)
+        except (BlockingIOError, socket.timeout):
+            return True
+        finally:
+            self.sock.setblocking(False)
+        if not data:
+            return False
+
+        self.inbox += data
+        *lines, self.inbox = self.inbox.split(b"\n")
+        for line in lines:
+            if line.strip():
+                self._apply(json.loads(line))
+        return True
+
+    def _apply(self, message):
+        kind = message["type"]
+        if kind == "welcome":
+            self.player_id = message["id"]
+            self.state = message["state"]
+            self.index = MonsterIndex(self.state["monsters"])
+            self.players = {int(pid): pos for pid, pos in message["players"].items()}
+            self.players[self.player_id] = self.players.get(self.player_id, [0, 0])
+        elif kind == "delta":
+            for pid, pos in message.get("players", {}).items():
+                self.players[int(pid)] = pos
+            for pid in message.get("left", []):
+                self.players.pop(pid, None)
+            for old_x, old_y, new_x, new_y in message.get("moves", []):
+                monster = self.index.get((old_x, old_y))
+                if monster is not None:
+                    self.index.move(monster, (new_x, new_y))
+            for x, y in message.get("removed", []):
+                self.index.remove((x, y))
+            for x, y, health in message.get("damaged", []):
+                monster = self.index.get((x, y))
+                if monster is not None:
+                    monster["health"] = health
+            for monster in message.get("spawned", []):
+                self.index.add(monster)
+        elif kind == "encounter":
+            self.encounter = message["monster"]
+
+    def report_fight(self, monster):
+        """
+        Tells the server how a fight ended; the server replies with a fresh copy of the world.
+        """
+        self.encounter = None
+        self.state = None
+        self.send({"type": "fight_result", "pos": monster["pos"], "health": monster["health"]})
+        self._wait_for_state()
+
+    def close(self):
+        """
+        Leaves the world and closes the connection.
+        """
+        try:
+            self.send({"type": "leave"})
+        except OSError:
+            pass
+        self.sock.close()
+
+def launch_shared_map(client):
+    """
+    Opens a map window for one player in the shared world. Key presses are sent to the
+    server, and the window draws whatever state the server has broadcast.
+
+    Args:
+        client (WorldClient): A connected client.
+
+    Returns:
+        dict: {"type": "monster", "monster": ...}, {"type": "town"} or {"type": "exit"}
+    """
+    pygame.init()
+    camera = gamefunctions.Camera(gamefunctions.VIEW_SIZE, gamefunctions.VIEW_SIZE, gamefunctions.GRID_SIZE,
+                                  gamefunctions.GRID_SIZE, gamefunctions.TILE_SIZE)
+    screen = pygame.display.set_mode(camera.pixel_size)
+    pygame.display.set_caption("Adventure Map (shared)")
+    clock = pygame.time.Clock()
+    player_image, monster_images = gamefunctions.load_map_images()
+    key_names = {pygame.K_UP: "up", pygame.K_DOWN: "down", pygame.K_LEFT: "left", pygame.K_RIGHT: "right"}
+
+    def leave_map(result):
+        pos = client.players.get(client.player_id)
+        if result["type"] == "exit":
+            eventbus.publish("map_exited", pos=pos, shared=True)
+        elif result["type"] == "monster":
+            eventbus.publish("map_encounter", monster=result["monster"]["name"], pos=pos,
+                             monster_hp=result["monster"]["health"], shared=True)
+        else:
+            eventbus.publish("map_reached_town", pos=pos, shared=True)
+        pygame.quit()
+        return result
+
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_x):
+                return leave_map({"type": "exit"})
+            if event.type == pygame.KEYDOWN and event.key in key_names:
+                client.send({"type": "input", "key": key_names[event.key]})
+
+        if not client.poll():
+            return leave_map({"type": "exit"})
+        if client.encounter is not None:
+            return leave_map({"type": "monster", "monster": client.encounter})
+        if client.player_pos == client.state["town_pos"]:
+            return leave_map({"type": "town"})
+
+        camera.follow(client.player_pos)
+        gamefunctions.draw_map(screen, client.state, client.player_pos, client.state["town_pos"],
+                               player_image, monster_images, camera=camera, monster_index=client.index)
+
+        # Other players are drawn as light blue squares
+        for pid, pos in client.players.items():
+            if pid != client.player_id and camera.is_visible(pos):
+                x, y = camera.to_screen(pos[0], pos[1])
+                pygame.draw.rect(screen, (100, 180, 255),
+                                 pygame.Rect(x, y, gamefunctions.TILE_SIZE, gamefunctions.TILE_SIZE))
+
+        pygame.display.flip()
+        clock.tick(30)
+
+def explore_shared_world(address, name, player_hp, player_gold, inventory, equipped_weapon, doctor_visits):
+    """
+    Plays the shared map until the player returns to town or closes the window.
+    Fights run locally and their results are sent to the server. This is the town
+    menu's "Join Shared World" option; the server must already be running.
+
+    Returns:
+        tuple: Updated (player_hp, player_gold, equipped_weapon, doctor_visits)
+    """
+    try:
+        client = WorldClient(address, name)
+    except OSError:
+        print(f"No shared world is running at {address}. Start one with: python worldserver.py")
+        return player_hp, player_gold, equipped_weapon, doctor_visits
+    try:
+        while True:
+            result = launch_shared_map(client)
+            if result["type"] != "monster":
+                break
+            monster = result["monster"]
+            health_before_fight = monster["health"]
+            player_hp, player_gold, equipped_weapon, doctor_visits = gamefunctions.handle_adventure_with_monster(
+                player_hp, player_gold, inventory, equipped_weapon, doctor_visits, monster,
+                record_fight=client.report_fight)
+            if client.encounter is not None:
+                # The player lost and was revived. Like the local map, a lost fight isn't
+                # recorded, so report the monster's health from before the fight.
+                client.report_fight(dict(monster, health=health_before_fight))
+            print("Returning to the map...")
+    except ConnectionError:
+        print("Lost the connection to the shared world.")
+    finally:
+        client.close()
+    return player_hp, player_gold, equipped_weapon, doctor_visits
+
+def main():
+    """
+    Starts the world server from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Run the shared adventure world server.")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix socket path to listen on")
+    parser.add_argument("--port", type=int, help="listen on TCP 127.0.0.1:PORT instead of a Unix socket")
+    args = parser.parse_args()
+
+    address = ("127.0.0.1", args.port) if args.port else args.socket
+    WorldServer(address).serve_forever()
+
+if __name__ == "__main__":
+    main()